@@ -4,105 +4,42 @@ Flask 日期 API 應用程式
 此應用程式提供一個 POST API 端點，用於計算固定月份的日期區間。
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
 from date_calculator import DateCalculator, DateValidator
 from holiday_calculator import HolidayDateCalculator
 from interfaces import IFixedMonthDateCalculator, IDateValidator
-from typing import Dict, Any
+from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import requests
-import queue
 import threading
-from functools import wraps
 
 
 app = Flask(__name__)
 
-# 建立佇列用於管理 holiday_calculator 的請求
-holiday_request_queue = queue.Queue(maxsize=200)
-holiday_queue_lock = threading.Lock()
 
-
-def queue_task(func):
-    """
-    裝飾器：將任務加入佇列並依序執行，避免併發問題。
-    
-    Args:
-        func (Callable): 被裝飾的函數
-    
-    Returns:
-        Callable: 包裝後的函數
-    
-    Examples:
-        @queue_task
-        def some_function():
-            pass
-    
-    Raises:
-        queue.Full: 當佇列已滿時
+def ojsonify(obj: Any) -> Response:
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        result_container = {'result': None, 'exception': None}
-        event = threading.Event()
-        
-        def task():
-            try:
-                result_container['result'] = func(*args, **kwargs)
-            except Exception as e:
-                result_container['exception'] = e
-            finally:
-                event.set()
-        
-        # 將任務加入佇列
-        try:
-            holiday_request_queue.put(task, timeout=5)
-        except queue.Full:
-            raise Exception("系統繁忙，請稍後再試")
-        
-        # 啟動佇列處理
-        with holiday_queue_lock:
-            if not hasattr(wrapper, '_worker_started') or not wrapper._worker_started:
-                threading.Thread(target=_process_queue, daemon=True).start()
-                wrapper._worker_started = True
-        
-        # 等待任務完成
-        event.wait()
-        
-        if result_container['exception']:
-            raise result_container['exception']
-        
-        return result_container['result']
+    使用 orjson 將物件序列化為 JSON 響應。
     
-    return wrapper
-
-
-def _process_queue():
-    """
-    處理佇列中的任務。
+    取代 Flask 內建的 jsonify；orjson 為 C 擴充實作，直接輸出 UTF-8，
+    中文內容不需轉義為 \\uXXXX。
     
     Args:
-        無
+        obj (Any): 可序列化為 JSON 的物件
     
     Returns:
-        None
+        Response: mimetype 為 application/json 的 Flask 響應
     
     Examples:
-        不直接調用，由 queue_task 裝飾器自動啟動
+        >>> with app.app_context():
+        ...     ojsonify({"status": "healthy"}).get_data()
+        b'{"status":"healthy"}'
     
     Raises:
-        不拋出異常
+        orjson.JSONEncodeError: 當物件無法序列化時
     """
-    while True:
-        try:
-            task = holiday_request_queue.get(timeout=1)
-            task()
-            holiday_request_queue.task_done()
-        except queue.Empty:
-            continue
-        except Exception as e:
-            # 記錄錯誤但不中斷處理
-            print(f"處理佇列任務時發生錯誤: {e}")
-            holiday_request_queue.task_done()
+    return app.response_class(orjson.dumps(obj), mimetype='application/json')
 
 
 class DateAPIService:
@@ -153,30 +90,86 @@ class DateAPIService:
         Raises:
             不拋出異常，錯誤會在響應中返回
         """
-        # 驗證輸入
-        is_valid, error_message = self.validator.validate_input(data)
+        # 驗證輸入，並取得轉換後的整數參數
+        is_valid, error_message, parsed = self.validator.validate_input(data)
         if not is_valid:
             return {"error": error_message}, 400
         
-        # 計算日期
-        try:
-            result = self.calculator.calculate_dates(
-                int(data["month_offset"]),
-                int(data["dep_day"]),
-                int(data["return_day"])
-            )
-            return {
-                "success": True,
-                "data": result
-            }, 200
-        except ValueError as e:
-            return {"error": str(e)}, 400
+        # 計算日期（參數已通過驗證，不需重複檢查）
+        result = self.calculator.calculate_dates_unchecked(*parsed)
+        return {
+            "success": True,
+            "data": result
+        }, 200
 
 
 # 初始化服務
 date_service = DateAPIService(DateCalculator(), DateValidator())
 holiday_calculator = HolidayDateCalculator()
 
+# 預取節日資料的執行緒池，每個年份一個工作，限制同時對外部 API 發出的請求數量
+holiday_prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='holiday-prefetch')
+# 預取涵蓋的月份偏移量
+HOLIDAY_PREFETCH_MONTH_OFFSETS = range(12)
+# 重新預取的間隔（秒），每日一次以涵蓋跨月後新進入範圍的月份
+HOLIDAY_PREFETCH_INTERVAL_SECONDS = 24 * 60 * 60
+
+
+def _prefetch_holiday_year(target_year: int, month_offsets: List[int]) -> None:
+    """
+    預取指定年份的節日資料，並預先產生該年份內各月份偏移量的響應。
+    
+    外部 API 以整年為單位提供資料，因此每個年份只獲取一次；
+    獲取失敗時記錄一次錯誤並略過該年份的所有月份偏移量。
+    
+    Args:
+        target_year (int): 目標年份
+        month_offsets (List[int]): 該年份內的月份偏移量列表
+    
+    Returns:
+        None
+    
+    Examples:
+        不直接調用，由 schedule_holiday_prefetch 提交至執行緒池
+    
+    Raises:
+        不拋出異常，錯誤僅記錄後忽略，實際請求時會重新獲取
+    """
+    try:
+        if not holiday_calculator.prefetch_year(target_year, month_offsets):
+            print(f"預取 {target_year} 年節假日資料失敗，外部 API 未成功回應")
+    except Exception as e:
+        print(f"預取 {target_year} 年節假日資料時發生錯誤: {e}")
+
+
+def schedule_holiday_prefetch() -> None:
+    """
+    在背景預取常用月份偏移量的節日資料，並排程每日重新預取。
+    
+    讓 /calculate_holiday_dates 的請求在暖機後皆命中緩存，
+    不必在請求路徑上等待外部 API。由 gunicorn.conf.py 的 post_worker_init 於每個 worker 啟動時呼叫。
+    
+    Args:
+        無
+    
+    Returns:
+        None
+    
+    Examples:
+        >>> schedule_holiday_prefetch()  # doctest: +SKIP
+    
+    Raises:
+        不拋出異常
+    """
+    # 依目標年份分組，每個年份只向外部 API 獲取一次
+    offsets_by_year = holiday_calculator.group_offsets_by_year(HOLIDAY_PREFETCH_MONTH_OFFSETS)
+    for target_year, month_offsets in offsets_by_year.items():
+        holiday_prefetch_executor.submit(_prefetch_holiday_year, target_year, month_offsets)
+    
+    timer = threading.Timer(HOLIDAY_PREFETCH_INTERVAL_SECONDS, schedule_holiday_prefetch)
+    timer.daemon = True
+    timer.start()
+
 
 @app.route('/calculate_dates', methods=['POST'])
 def calculate_dates():
@@ -216,13 +209,13 @@ def calculate_dates():
     Raises:
         不直接拋出異常，錯誤會在 JSON 響應中返回
     """
-    data = request.get_json()
+    data = request.get_json(silent=True)
     
-    if not data:
-        return jsonify({"error": "請求體必須為 JSON 格式"}), 400
+    if not data or not isinstance(data, dict):
+        return ojsonify({"error": "請求體必須為 JSON 格式"}), 400
     
     response, status_code = date_service.process_request(data)
-    return jsonify(response), status_code
+    return ojsonify(response), status_code
 
 
 @app.route('/health', methods=['GET'])
@@ -245,28 +238,7 @@ def health_check():
     Raises:
         不拋出異常
     """
-    return jsonify({"status": "healthy"}), 200
-
-
-@queue_task
-def _calculate_holiday_dates_with_queue(month_offset: int) -> Dict[str, Any]:
-    """
-    使用佇列機制計算節日日期（內部函數）。
-    
-    Args:
-        month_offset (int): 月份偏移量
-    
-    Returns:
-        Dict[str, Any]: 計算結果
-    
-    Examples:
-        不直接調用，由 calculate_holiday_dates API 端點使用
-    
-    Raises:
-        ValueError: 當參數無效時
-        requests.RequestException: 當 API 請求失敗時
-    """
-    return holiday_calculator.calculate_dates(month_offset)
+    return ojsonify({"status": "healthy"}), 200
 
 
 @app.route('/calculate_holiday_dates', methods=['POST'])
@@ -275,7 +247,7 @@ def calculate_holiday_dates():
     計算節日日期區間的 API 端點。
     
     接收 POST 請求，計算基於月份偏移量的節假日日期區間。
-    使用佇列機制避免併發問題。
+    請求由 WSGI 伺服器的執行緒並行處理，不再經過單一工作執行緒排隊。
     
     Args:
         無直接參數，從 request.json 獲取：
@@ -313,38 +285,33 @@ def calculate_holiday_dates():
     Raises:
         不直接拋出異常，錯誤會在 JSON 響應中返回
     """
-    data = request.get_json()
+    data = request.get_json(silent=True)
     
-    if not data:
-        return jsonify({"error": "請求體必須為 JSON 格式"}), 400
+    if not data or not isinstance(data, dict):
+        return ojsonify({"error": "請求體必須為 JSON 格式"}), 400
     
     # 驗證必要參數
     if "month_offset" not in data:
-        return jsonify({"error": "缺少必要參數：month_offset"}), 400
+        return ojsonify({"error": "缺少必要參數：month_offset"}), 400
     
     try:
         month_offset = int(data["month_offset"])
-    except (ValueError, TypeError):
-        return jsonify({"error": "month_offset 必須為整數類型"}), 400
-    
-    # 驗證數值範圍
-    if month_offset < 0:
-        return jsonify({"error": "month_offset 必須為非負整數"}), 400
+    except (ValueError, TypeError, OverflowError):
+        return ojsonify({"error": "month_offset 必須為整數類型"}), 400
     
-    # 使用佇列機制計算節日日期
+    # 計算節日日期，直接返回已序列化（並緩存）的響應內容；數值範圍由計算器檢查
     try:
-        result = _calculate_holiday_dates_with_queue(month_offset)
-        return jsonify({
-            "success": True,
-            "data": result
-        }), 200
+        body = holiday_calculator.calculate_dates_bytes(month_offset)
+        return app.response_class(body, mimetype='application/json'), 200
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400
+        return ojsonify({"error": str(e)}), 400
     except requests.RequestException as e:
-        return jsonify({"error": f"無法獲取節假日資料：{str(e)}"}), 500
+        return ojsonify({"error": f"無法獲取節假日資料：{str(e)}"}), 500
 
 
 if __name__ == '__main__':
+    # 僅供本機開發使用，生產環境請使用 gunicorn（見 gunicorn.conf.py）
     import os
     port = int(os.environ.get('PORT', 8080))
-    app.run(debug=True, host='0.0.0.0', port=port)
+    debug = os.environ.get('FLASK_ENV') == 'development'
+    app.run(debug=debug, host='0.0.0.0', port=port)
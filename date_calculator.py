@@ -4,14 +4,52 @@
 此模組負責處理固定月份的日期計算邏輯。
 """
 
-from datetime import datetime
-import calendar
-from typing import Dict
-from interfaces import IFixedMonthDateCalculator, IDateValidator
-from zoneinfo import ZoneInfo
+from typing import Dict, Optional, Final
+from taipei_clock import now_taipei
 
 
-class DateCalculator(IFixedMonthDateCalculator):
+# 平年各月份天數（索引 0 為一月）
+_DAYS_IN_MONTH: Final[tuple[int, ...]] = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# 月份偏移量上限（100 年），更遠的月份沒有實際意義，也避免 orjson 無法序列化超過 64 位元的年份
+MAX_MONTH_OFFSET: Final[int] = 1200
+
+# 輸入欄位驗證規則：(欄位名稱, 最小值, 最大值, 超出範圍時的錯誤訊息)，最大值為 None 表示不設上限
+_FIELD_RULES: Final[tuple[tuple[str, int, Optional[int], str], ...]] = (
+    ("month_offset", 0, MAX_MONTH_OFFSET, f"month_offset 必須為非負整數且不超過 {MAX_MONTH_OFFSET}"),
+    ("dep_day", 1, 31, "dep_day 必須在 1-31 之間"),
+    ("return_day", 1, 31, "return_day 必須在 1-31 之間"),
+)
+_REQUIRED_FIELDS: Final[frozenset[str]] = frozenset(rule[0] for rule in _FIELD_RULES)
+_MISSING_FIELDS_ERROR: Final[str] = f"缺少必要參數：{', '.join(rule[0] for rule in _FIELD_RULES)}"
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """
+    計算指定年月的天數。
+    
+    Args:
+        year (int): 年份
+        month (int): 月份（1-12）
+    
+    Returns:
+        int: 該月份的天數
+    
+    Examples:
+        >>> _days_in_month(2024, 2)
+        29
+        >>> _days_in_month(2025, 2)
+        28
+    
+    Raises:
+        IndexError: 當月份不在 1-12 範圍內時
+    """
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+class DateCalculator:
     """
     日期計算器類別
     
@@ -43,30 +81,56 @@ class DateCalculator(IFixedMonthDateCalculator):
             {'departure_date': '2025-12-05', 'return_date': '2025-12-10', 'target_year': 2025, 'target_month': 12}
         
         Raises:
-            ValueError: 當 month_offset 小於 0 時
+            ValueError: 當 month_offset 小於 0 或超過 MAX_MONTH_OFFSET 時
             ValueError: 當 dep_day 或 return_day 不在 1-31 範圍內時
         """
         if month_offset < 0:
             raise ValueError(f"月份偏移量必須為非負整數，目前值為 {month_offset}")
         
+        if month_offset > MAX_MONTH_OFFSET:
+            raise ValueError(f"月份偏移量不得超過 {MAX_MONTH_OFFSET}，目前值為 {month_offset}")
+        
         if not 1 <= dep_day <= 31:
             raise ValueError(f"出發日期天數必須在 1-31 之間，目前值為 {dep_day}")
         
         if not 1 <= return_day <= 31:
             raise ValueError(f"回程日期天數必須在 1-31 之間，目前值為 {return_day}")
         
+        return self.calculate_dates_unchecked(month_offset, dep_day, return_day)
+
+    def calculate_dates_unchecked(self, month_offset: int, dep_day: int, return_day: int) -> Dict[str, str]:
+        """
+        根據月份偏移量計算目標日期區間，不重複檢查參數範圍。
+        
+        供已通過 DateValidator 驗證的輸入使用，避免重複的範圍檢查。
+        
+        Args:
+            month_offset (int): 月份偏移量，必須已確認在 0 到 MAX_MONTH_OFFSET 之間
+            dep_day (int): 出發日期的天數，必須已確認在 1-31 之間
+            return_day (int): 回程日期的天數，必須已確認在 1-31 之間
+        
+        Returns:
+            Dict[str, str]: 與 calculate_dates 相同格式的日期字典
+        
+        Examples:
+            >>> calculator = DateCalculator()
+            >>> result = calculator.calculate_dates_unchecked(2, 5, 10)
+            >>> result["departure_date"].endswith("-05")
+            True
+        
+        Raises:
+            不拋出異常
+        """
         # 獲取當前日期
-        current_date = datetime.now(ZoneInfo("Asia/Taipei"))
-        target_year = current_date.year
-        target_month = current_date.month + month_offset
+        current_date = now_taipei()
         
         # 處理跨年情況
-        while target_month > 12:
-            target_month -= 12
-            target_year += 1
+        year_offset, month_index = divmod(current_date.month - 1 + month_offset, 12)
+        target_year = current_date.year + year_offset
+        target_month = month_index + 1
         
         # 獲取目標月份的天數
-        days_in_month = calendar.monthrange(target_year, target_month)[1]
+        days_in_month = _days_in_month(target_year, target_month)
         
         # 確保日期不超過該月份的最大天數
         actual_dep_day = min(dep_day, days_in_month)
@@ -84,56 +148,48 @@ class DateCalculator(IFixedMonthDateCalculator):
         }
 
 
-class DateValidator(IDateValidator):
+class DateValidator:
     """
     日期驗證器類別
     
     負責驗證輸入參數的有效性。
     """
 
-    def validate_input(self, data: Dict) -> tuple[bool, str]:
+    def validate_input(self, data: Dict) -> tuple[bool, str, Optional[tuple[int, int, int]]]:
         """
-        驗證輸入數據的有效性。
+        驗證輸入數據的有效性，並返回轉換後的整數參數。
         
         Args:
             data (Dict): 包含輸入數據的字典，應包含 month_offset、dep_day、return_day
         
         Returns:
-            tuple[bool, str]: (是否有效, 錯誤訊息)，如果有效則錯誤訊息為空字符串
+            tuple[bool, str, Optional[tuple[int, int, int]]]: (是否有效, 錯誤訊息, 轉換後的參數)，
+                有效時錯誤訊息為空字符串、參數為 (month_offset, dep_day, return_day)；
+                無效時參數為 None
         
         Examples:
             >>> validator = DateValidator()
             >>> validator.validate_input({"month_offset": 2, "dep_day": 5, "return_day": 10})
-            (True, '')
+            (True, '', (2, 5, 10))
             >>> validator.validate_input({"month_offset": -1, "dep_day": 5, "return_day": 10})
-            (False, '缺少必要參數：month_offset, dep_day, return_day')
+            (False, 'month_offset 必須為非負整數且不超過 1200', None)
         
         Raises:
             不拋出異常，返回驗證結果
         """
-        required_fields = ["month_offset", "dep_day", "return_day"]
-        
         # 檢查必要欄位
-        missing_fields = [field for field in required_fields if field not in data]
-        if missing_fields:
-            return False, f"缺少必要參數：{', '.join(required_fields)}"
+        if not isinstance(data, dict) or not _REQUIRED_FIELDS.issubset(data):
+            return False, _MISSING_FIELDS_ERROR, None
         
         # 檢查數據類型
         try:
-            month_offset = int(data["month_offset"])
-            dep_day = int(data["dep_day"])
-            return_day = int(data["return_day"])
-        except (ValueError, TypeError):
-            return False, "參數必須為整數類型"
+            values = tuple(int(data[field]) for field, _, _, _ in _FIELD_RULES)
+        except (ValueError, TypeError, OverflowError):
+            return False, "參數必須為整數類型", None
         
         # 檢查數值範圍
-        if month_offset < 0:
-            return False, "month_offset 必須為非負整數"
-        
-        if not 1 <= dep_day <= 31:
-            return False, "dep_day 必須在 1-31 之間"
-        
-        if not 1 <= return_day <= 31:
-            return False, "return_day 必須在 1-31 之間"
+        for value, (_, minimum, maximum, error_message) in zip(values, _FIELD_RULES):
+            if value < minimum or (maximum is not None and value > maximum):
+                return False, error_message, None
         
-        return True, ""
+        return True, "", values
@@ -0,0 +1,48 @@
+"""
+Gunicorn 設定檔
+
+生產環境以 gevent worker 執行 Flask 應用程式。節日 API 在緩存未命中時會
+等待外部 API 回應，gevent 的 monkey patch 讓 requests/urllib3 在等待 socket
+時自動讓出執行權，單一 worker 即可同時服務大量 I/O 等待中的請求。
+
+各項設定皆可透過環境變數覆寫。
+"""
+
+import os
+
+
+# 綁定位址，Cloud Run 會注入 PORT 環境變數
+bind = f":{os.environ.get('PORT', '8080')}"
+
+# worker 數量，預設為 1：部署規格為 1 CPU / 512Mi，且各 worker 各自持有一份節日緩存，
+# 多開 worker 只會重複預取與佔用記憶體；並發由 gevent 負責。可用 GUNICORN_WORKERS 或 WEB_CONCURRENCY 覆寫
+workers = int(os.environ.get('GUNICORN_WORKERS', os.environ.get('WEB_CONCURRENCY', 1)))
+
+# worker 類型，gevent 適合 I/O 密集的工作
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gevent')
+
+# 每個 gevent worker 可同時處理的連線數
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 1000))
+
+# 停用 worker 逾時，交由 Cloud Run 的請求逾時控制
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 0))
+
+
+def post_worker_init(worker):
+    """
+    worker 載入應用程式後，於背景預取節日資料以暖機緩存。
+    
+    Args:
+        worker: gunicorn worker 實例
+    
+    Returns:
+        None
+    
+    Examples:
+        由 gunicorn 自動呼叫
+    
+    Raises:
+        不拋出異常
+    """
+    from app import schedule_holiday_prefetch
+    schedule_holiday_prefetch()
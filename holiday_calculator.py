@@ -5,11 +5,120 @@
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Dict, Iterable, List, Any, Final
+from collections import defaultdict
+from functools import lru_cache
+import re
+import threading
+import orjson
 import requests
-import json
-from interfaces import IHolidayDateCalculator
-from zoneinfo import ZoneInfo
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from date_calculator import MAX_MONTH_OFFSET
+from taipei_clock import now_taipei
+
+
+def _format_iso_date(date_str: str) -> str:
+    """
+    將 YYYYMMDD 日期字串轉換為 YYYY-MM-DD 格式。
+    
+    僅做字串切片，呼叫端需確保輸入已是有效的 YYYYMMDD 日期。
+    
+    Args:
+        date_str (str): YYYYMMDD 格式的日期字串
+    
+    Returns:
+        str: YYYY-MM-DD 格式的日期字串
+    
+    Examples:
+        >>> _format_iso_date('20250101')
+        '2025-01-01'
+    
+    Raises:
+        不拋出異常
+    """
+    return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}"
+
+
+# 需要跳過的節日（春節、農曆除夕），預先編譯為單一正則表達式
+_SKIP_HOLIDAY_PATTERN: Final[re.Pattern[str]] = re.compile('春節|農曆除夕')
+
+# YYYYMMDD 日期字串中月份部分（MM）對應的月份數字
+_MONTH_KEYS: Final[Dict[str, int]] = {f"{month:02d}": month for month in range(1, 13)}
+
+# 星期幾字元對應的索引（一 = 0 ... 日 = 6）
+_WEEKDAY_INDEX: Final[Dict[str, int]] = {'一': 0, '二': 1, '三': 2, '四': 3, '五': 4, '六': 5, '日': 6}
+
+
+def _build_weekday_rules(offsets: tuple[tuple[int, int], ...]) -> tuple[tuple[timedelta, timedelta], ...]:
+    """
+    將 (前幾天, 後幾天) 的天數規則轉換為 timedelta，依星期索引排列。
+    
+    Args:
+        offsets (tuple[tuple[int, int], ...]): 依星期一到星期日排列的 (days_before, days_after) 天數
+    
+    Returns:
+        tuple[tuple[timedelta, timedelta], ...]: 依星期一到星期日排列的 (timedelta, timedelta)
+    
+    Examples:
+        >>> _build_weekday_rules(((-1, 2),))
+        ((datetime.timedelta(days=-1), datetime.timedelta(days=2)),)
+    
+    Raises:
+        不拋出異常
+    """
+    return tuple((timedelta(days=before), timedelta(days=after)) for before, after in offsets)
+
+
+# 小年夜規則（依星期一到星期日排列）
+_LUNAR_NEW_YEAR_RULES: Final[tuple[tuple[timedelta, timedelta], ...]] = _build_weekday_rules((
+    (-2, 4), (-3, 3), (-4, 2), (-2, 4), (-2, 4), (-2, 3), (-2, 3)
+))
+
+# 一般國定假日規則（依星期一到星期日排列）
+_GENERAL_HOLIDAY_RULES: Final[tuple[tuple[timedelta, timedelta], ...]] = _build_weekday_rules((
+    (-4, 0), (-4, 0), (0, 3), (-1, 3), (-2, 2), (-3, 1), (-4, 0)
+))
+
+# 模組層級共用的 HTTP 連線池
+# 必須在模組層級建立（而非每次請求建立），才能在多次 Flask 請求之間保留
+# TCP/TLS 連線，避免每次緩存未命中都重新握手；urllib3 的連線池為執行緒安全。
+_SESSION: Final[requests.Session] = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+
+def _parse_holiday_date(holiday: Dict) -> datetime:
+    """
+    取得節假日的日期物件。
+    
+    優先使用寫入緩存時預先解析的 `_date_obj`，若不存在才解析 `date` 欄位。
+    
+    Args:
+        holiday (Dict): 節假日資料，包含 date（YYYYMMDD 格式）
+    
+    Returns:
+        datetime: 節假日日期
+    
+    Examples:
+        >>> _parse_holiday_date({'date': '20250101'})
+        datetime.datetime(2025, 1, 1, 0, 0)
+    
+    Raises:
+        ValueError: 當日期格式無效時
+    """
+    holiday_date = holiday.get('_date_obj')
+    if holiday_date is not None:
+        return holiday_date
+    
+    date_str = holiday.get('date', '')
+    try:
+        return datetime.strptime(date_str, "%Y%m%d")
+    except ValueError as e:
+        raise ValueError(f"無效的日期格式：{date_str}")
 
 
 class HolidayDataCache:
@@ -18,8 +127,11 @@ class HolidayDataCache:
     
     負責管理節假日數據的緩存操作，遵循單一職責原則（SRP）。
     """
-    # 類別級別的共享緩存，所有實例共用
-    _shared_cache: Dict[int, Dict[int, List[Dict]]] = {}
+    # 類別級別的共享緩存，所有實例共用，以 (年份, 月份) 為鍵
+    # 讀取只做一次 dict 查詢、寫入只做一次參照賦值，兩者在 GIL 下皆為原子操作，讀取端不需加鎖
+    _shared_cache: Dict[tuple[int, int], List[Dict]] = {}
+    # 與 _shared_cache 配對的獲取鎖，以年份為鍵；月份偏移量不超過 MAX_MONTH_OFFSET，鎖的數量有上限
+    _shared_locks: defaultdict[int, threading.Lock] = defaultdict(threading.Lock)
 
     def __init__(self, cache_storage: Dict = None):
         """
@@ -28,7 +140,35 @@ class HolidayDataCache:
         Args:
             cache_storage (Dict): 緩存儲存容器，預設使用類別級別的 _shared_cache。
         """
-        self.cache_storage = cache_storage if cache_storage is not None else self._shared_cache
+        if cache_storage is not None:
+            self.cache_storage = cache_storage
+            self._locks = defaultdict(threading.Lock)
+        else:
+            self.cache_storage = self._shared_cache
+            self._locks = self._shared_locks
+
+    def get_or_fetch_lock(self, target_year: int) -> threading.Lock:
+        """
+        取得指定年份的獲取鎖。
+        
+        外部 API 以年份為單位提供資料，同一年份的緩存未命中只允許一個執行緒
+        下載並寫入整年資料，其他執行緒等待後直接讀取緩存；不同年份之間互不阻塞。
+        
+        Args:
+            target_year (int): 目標年份
+        
+        Returns:
+            threading.Lock: 該年份專屬的鎖
+        
+        Examples:
+            >>> cache = HolidayDataCache()
+            >>> with cache.get_or_fetch_lock(2025):
+            ...     pass
+        
+        Raises:
+            不拋出異常
+        """
+        return self._locks[target_year]
 
     def get_holiday_data_cache(self, target_year: int, target_month: int) -> List[Dict] | None:
         """
@@ -50,10 +190,7 @@ class HolidayDataCache:
         Raises:
             不拋出異常
         """
-        if target_year in self.cache_storage:
-            if target_month in self.cache_storage[target_year]:
-                return self.cache_storage[target_year][target_month]
-        return None
+        return self.cache_storage.get((target_year, target_month))
 
     def set_holiday_data_cache(self, target_year: int, target_month: int, data: List[Dict]) -> None:
         """
@@ -74,9 +211,7 @@ class HolidayDataCache:
         Raises:
             不拋出異常
         """
-        if target_year not in self.cache_storage:
-            self.cache_storage[target_year] = {}
-        self.cache_storage[target_year][target_month] = data
+        self.cache_storage[(target_year, target_month)] = data
 
     def has_holiday_data_cache(self, target_year: int, target_month: int) -> bool:
         """
@@ -97,7 +232,7 @@ class HolidayDataCache:
         Raises:
             不拋出異常
         """
-        return self.get_holiday_data_cache(target_year, target_month) is not None
+        return (target_year, target_month) in self.cache_storage
 
 
 class HolidayDataFetcher:
@@ -108,12 +243,13 @@ class HolidayDataFetcher:
     遵循單一職責原則（SRP），僅負責數據獲取，不處理緩存。
     """
 
-    def __init__(self, cache: HolidayDataCache = None):
+    def __init__(self, cache: HolidayDataCache = None, session: requests.Session = None):
         """
         初始化節日數據獲取器。
         
         Args:
             cache (HolidayDataCache): 緩存管理器實例，用於依賴注入
+            session (requests.Session): HTTP Session，預設使用模組層級共用的連線池
         
         Returns:
             None
@@ -125,11 +261,12 @@ class HolidayDataFetcher:
             不拋出異常
         """
         self.cache = cache or HolidayDataCache()
+        self.session = session or _SESSION
 
     def fetch_taiwan_holidays(self, target_year: int, target_month: int) -> List[Dict]:
         """
         從外部 API 獲取指定年月的台灣節假日資料。
-        優先從緩存讀取，若無緩存則調用外部 API 並儲存結果。
+        優先從緩存讀取，若無緩存則調用外部 API，並將整年各月份的結果一併儲存。
         
         Args:
             target_year (int): 目標年份
@@ -156,57 +293,103 @@ class HolidayDataFetcher:
         if cached_data is not None:
             return cached_data
         
-        # 緩存中沒有資料，從外部 API 獲取
-        url = f"https://cdn.jsdelivr.net/gh/ruyut/TaiwanCalendar/data/{target_year}.json"
-        holidays_data = []
+        # 同一年份只由一個執行緒獲取，其餘執行緒等待後讀取緩存
+        with self.cache.get_or_fetch_lock(target_year):
+            cached_data = self.cache.get_holiday_data_cache(target_year, target_month)
+            if cached_data is not None:
+                return cached_data
+            
+            # 緩存中沒有資料，從外部 API 獲取
+            url = f"https://cdn.jsdelivr.net/gh/ruyut/TaiwanCalendar/data/{target_year}.json"
+            holidays_data = []
+            
+            try:
+                response = self.session.get(url, timeout=10)
+                if response.status_code == 200:
+                    # 直接解析位元組，只需移除 UTF-8 BOM，不必先整段解碼成字串
+                    year_data = orjson.loads(response.content.removeprefix(b'\xef\xbb\xbf'))
+                    
+                    # 整年資料已下載，一次依月份分組並全部寫入緩存，其他月份不必再重新下載
+                    holidays_by_month = HolidayDataFetcher._group_holidays_by_month(year_data, target_year)
+                    for month, month_holidays in holidays_by_month.items():
+                        # 寫入緩存前預先解析日期，之後每次請求不必重複解析
+                        HolidayDataFetcher._preparse_holiday_dates(month_holidays)
+                        self.cache.set_holiday_data_cache(target_year, month, month_holidays)
+                    
+                    holidays_data = holidays_by_month[target_month]
+                    
+            except requests.RequestException as e:
+                raise requests.RequestException(f"無法獲取 {target_year} 年 {target_month} 月節假日資料: {e}")
+            
+            return holidays_data
+
+    @staticmethod
+    def _group_holidays_by_month(year_data: List[Dict], target_year: int) -> Dict[int, List[Dict]]:
+        """
+        將整年的資料過濾後依月份分組。
         
-        try:
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                year_data = response.content.decode('utf-8-sig')
-                year_data = json.loads(year_data)
-                
-                # 只保留指定月份且有 description 的節假日
-                for holiday in year_data:
-                    if (holiday.get('isHoliday') and 
-                        holiday.get('description') != '' and
-                        holiday['date'].startswith(f"{target_year}{target_month:02d}")):
-                        holidays_data.append(holiday)
-                
-                # 剔除補假
-                holidays_data = HolidayDataFetcher._remove_compensatory_holidays(holidays_data)
-                
-                # 儲存到緩存
-                self.cache.set_holiday_data_cache(target_year, target_month, holidays_data)
-                
-        except requests.RequestException as e:
-            raise requests.RequestException(f"無法獲取 {target_year} 年 {target_month} 月節假日資料: {e}")
+        只保留指定年份、為假日且有 description 的資料，並剔除描述中含「補」字的補假。
+        
+        Args:
+            year_data (List[Dict]): 外部 API 返回的整年資料
+            target_year (int): 目標年份
         
-        return holidays_data
+        Returns:
+            Dict[int, List[Dict]]: 月份（1-12）對應的節假日資料列表，沒有節假日的月份為空列表
+        
+        Examples:
+            >>> data = [{'date': '20250101', 'isHoliday': True, 'description': '開國紀念日'}]
+            >>> grouped = HolidayDataFetcher._group_holidays_by_month(data, 2025)
+            >>> len(grouped[1]), len(grouped[2])
+            (1, 0)
+        
+        Raises:
+            不拋出異常
+        """
+        year_prefix = str(target_year)
+        holidays_by_month = {month: [] for month in range(1, 13)}
+        for holiday in year_data:
+            if not (holiday.get('isHoliday')
+                    and (description := holiday.get('description'))
+                    and '補' not in description):
+                continue
+            date_str = holiday['date']
+            if date_str.startswith(year_prefix):
+                month_holidays = holidays_by_month.get(_MONTH_KEYS.get(date_str[4:6]))
+                if month_holidays is not None:
+                    month_holidays.append(holiday)
+        return holidays_by_month
 
     @staticmethod
-    def _remove_compensatory_holidays(holidays_data: List[Dict]) -> List[Dict]:
+    def _preparse_holiday_dates(holidays_data: List[Dict]) -> None:
         """
-        剔除 API 描述中補假的國定假日。
+        預先解析節假日日期並存回資料中。
         
-        如果資料中包含「補」這個字，則剔除。
+        為每筆資料加入 `_date_obj`（datetime）與 `_date_iso`（YYYY-MM-DD 字串），
+        日期格式錯誤的資料保持原樣，留待計算時跳過。
         
         Args:
             holidays_data (List[Dict]): 節假日資料列表
         
         Returns:
-            List[Dict]: 剔除補假後的節假日資料列表
+            None
         
         Examples:
-            >>> data = [{'description': '元旦'}, {'description': '元旦補假'}]
-            >>> result = HolidayDataFetcher._remove_compensatory_holidays(data)
-            >>> len(result)
-            1
+            >>> data = [{'date': '20250101'}]
+            >>> HolidayDataFetcher._preparse_holiday_dates(data)
+            >>> data[0]['_date_iso']
+            '2025-01-01'
         
         Raises:
             不拋出異常
         """
-        return [holiday for holiday in holidays_data if '補' not in holiday.get('description', '')]
+        for holiday in holidays_data:
+            try:
+                holiday_date = datetime.strptime(holiday.get('date', ''), "%Y%m%d")
+            except ValueError:
+                continue
+            holiday['_date_obj'] = holiday_date
+            holiday['_date_iso'] = _format_iso_date(holiday['date'])
 
 
 class HolidayDateRangeCalculator:
@@ -237,17 +420,13 @@ class HolidayDateRangeCalculator:
             ValueError: 當日期格式無效時
         """
         # 解析日期
-        date_str = holiday['date']
-        try:
-            holiday_date = datetime.strptime(date_str, "%Y%m%d")
-        except ValueError as e:
-            raise ValueError(f"無效的日期格式：{date_str}")
+        holiday_date: datetime = _parse_holiday_date(holiday)
         
-        weekday = holiday.get('week', '')
-        description = holiday.get('description', '')
+        weekday: str = holiday.get('week', '')
+        description: str = holiday.get('description', '')
         
         # 根據不同情況設定爬取日期
-        if '開國紀念日' in description and weekday == '三':
+        if weekday == '三' and '開國紀念日' in description:
             # 開國紀念日落在週三的特殊規則
             crawl_dates = (holiday_date - timedelta(days=4), holiday_date)
         elif '小年夜' in description:
@@ -264,10 +443,13 @@ class HolidayDateRangeCalculator:
         return crawl_dates
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _calculate_lunar_new_year_range(holiday_date: datetime, weekday: str) -> tuple[datetime, datetime]:
         """
         計算小年夜的日期範圍。
         
+        此為純函數，相同的 (日期, 星期幾) 會直接返回 lru_cache 中的結果。
+        
         Args:
             holiday_date (datetime): 小年夜日期
             weekday (str): 星期幾
@@ -284,27 +466,21 @@ class HolidayDateRangeCalculator:
         Raises:
             不拋出異常
         """
-        weekday_rules = {
-            '一': (-2, 4),
-            '二': (-3, 3),
-            '三': (-4, 2),
-            '四': (-2, 4),
-            '五': (-2, 4),
-            '六': (-2, 3),
-            '日': (-2, 3)
-        }
-        
-        days_before, days_after = weekday_rules.get(weekday, (-2, 4))
+        # 未知的星期幾沿用星期一的規則
+        days_before, days_after = _LUNAR_NEW_YEAR_RULES[_WEEKDAY_INDEX.get(weekday, 0)]
         return (
-            holiday_date + timedelta(days=days_before),
-            holiday_date + timedelta(days=days_after)
+            holiday_date + days_before,
+            holiday_date + days_after
         )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _calculate_general_holiday_range(holiday_date: datetime, weekday: str) -> tuple[datetime, datetime]:
         """
         計算一般國定假日的日期範圍。
         
+        此為純函數，相同的 (日期, 星期幾) 會直接返回 lru_cache 中的結果。
+        
         Args:
             holiday_date (datetime): 假日日期
             weekday (str): 星期幾
@@ -321,20 +497,11 @@ class HolidayDateRangeCalculator:
         Raises:
             不拋出異常
         """
-        weekday_rules = {
-            '一': (-4, 0),
-            '二': (-4, 0),
-            '三': (0, 3),
-            '四': (-1, 3),
-            '五': (-2, 2),
-            '六': (-3, 1),
-            '日': (-4, 0)
-        }
-        
-        days_before, days_after = weekday_rules.get(weekday, (-4, 0))
+        # 未知的星期幾沿用星期一的規則
+        days_before, days_after = _GENERAL_HOLIDAY_RULES[_WEEKDAY_INDEX.get(weekday, 0)]
         return (
-            holiday_date + timedelta(days=days_before),
-            holiday_date + timedelta(days=days_after)
+            holiday_date + days_before,
+            holiday_date + days_after
         )
 
 
@@ -369,20 +536,14 @@ class HolidayFilter:
         Raises:
             ValueError: 當日期格式無效時
         """
-        description = holiday.get('description', '')
+        description: str = holiday.get('description', '')
         
         # 跳過春節和農曆除夕
-        if any(keyword in description for keyword in ['春節', '農曆除夕']):
+        if _SKIP_HOLIDAY_PATTERN.search(description):
             return True
         
         # 跳過與固定區間重疊的日期
-        date_str = holiday.get('date', '')
-        try:
-            holiday_date = datetime.strptime(date_str, "%Y%m%d")
-        except ValueError as e:
-            raise ValueError(f"無效的日期格式：{date_str}")
-        
-        day = holiday_date.day
+        day: int = _parse_holiday_date(holiday).day
         
         # 2個月後的5-10號
         if month_offset == 2 and 5 <= day <= 10:
@@ -394,7 +555,7 @@ class HolidayFilter:
         return False
 
 
-class HolidayDateCalculator(IHolidayDateCalculator):
+class HolidayDateCalculator:
     """
     節日日期計算器
     
@@ -418,8 +579,6 @@ class HolidayDateCalculator(IHolidayDateCalculator):
         
         Examples:
             >>> calculator = HolidayDateCalculator()
-            >>> isinstance(calculator, IHolidayDateCalculator)
-            True
         
         Raises:
             不拋出異常
@@ -427,6 +586,10 @@ class HolidayDateCalculator(IHolidayDateCalculator):
         self.data_fetcher = data_fetcher or HolidayDataFetcher()
         self.range_calculator = range_calculator or HolidayDateRangeCalculator()
         self.holiday_filter = holiday_filter or HolidayFilter()
+        # 計算結果緩存，鍵值為 (目標年份, 目標月份, 月份偏移量)
+        self._result_cache: Dict[tuple[int, int, int], Dict[str, Any]] = {}
+        # 已序列化的 API 成功響應緩存，鍵值同上
+        self._response_bytes_cache: Dict[tuple[int, int, int], bytes] = {}
 
     def calculate_dates(self, month_offset: int) -> Dict[str, Any]:
         """
@@ -460,21 +623,145 @@ class HolidayDateCalculator(IHolidayDateCalculator):
             True
         
         Raises:
-            ValueError: 當 month_offset 小於 0 時
+            ValueError: 當 month_offset 小於 0 或超過 MAX_MONTH_OFFSET 時
             requests.RequestException: 當無法獲取節假日數據時
         """
-        if month_offset < 0:
-            raise ValueError(f"月份偏移量必須為非負整數，目前值為 {month_offset}")
+        HolidayDateCalculator._validate_month_offset(month_offset)
+        target_year, target_month = HolidayDateCalculator._resolve_target_month(month_offset)
+        result = self._get_result(target_year, target_month, month_offset)
         
-        # 計算目標年月
-        current_date = datetime.now(ZoneInfo("Asia/Taipei"))
-        target_year = current_date.year
-        target_month = current_date.month + month_offset
+        # 已緩存的結果需複製後返回，避免呼叫端修改到緩存內容
+        if (target_year, target_month, month_offset) in self._result_cache:
+            return HolidayDateCalculator._copy_result(result)
         
-        # 處理跨年情況
-        while target_month > 12:
-            target_month -= 12
-            target_year += 1
+        return result
+
+    def calculate_dates_bytes(self, month_offset: int) -> bytes:
+        """
+        計算節假日日期範圍，並返回已序列化的 API 成功響應。
+        
+        響應內容為 {"success": true, "data": calculate_dates 的結果} 的 JSON 位元組，
+        同一目標年月的響應只序列化一次，之後直接返回緩存的位元組。
+        
+        Args:
+            month_offset (int): 月份偏移量，表示從當前月份往後推幾個月
+        
+        Returns:
+            bytes: UTF-8 編碼的 JSON 響應內容
+        
+        Examples:
+            >>> calculator = HolidayDateCalculator()
+            >>> body = calculator.calculate_dates_bytes(2)
+            >>> body.startswith(b'{"success":true')
+            True
+        
+        Raises:
+            ValueError: 當 month_offset 小於 0 或超過 MAX_MONTH_OFFSET 時
+            requests.RequestException: 當無法獲取節假日數據時
+        """
+        HolidayDateCalculator._validate_month_offset(month_offset)
+        target_year, target_month = HolidayDateCalculator._resolve_target_month(month_offset)
+        cache_key = (target_year, target_month, month_offset)
+        cached_body = self._response_bytes_cache.get(cache_key)
+        if cached_body is not None:
+            return cached_body
+        
+        # 只做序列化、不會修改結果，直接使用緩存中的結果而不複製
+        result = self._get_result(target_year, target_month, month_offset)
+        body = orjson.dumps({"success": True, "data": result})
+        
+        # 與結果緩存一致：只有結果已被緩存時才緩存響應
+        if cache_key in self._result_cache:
+            self._response_bytes_cache[cache_key] = body
+        
+        return body
+
+    def group_offsets_by_year(self, month_offsets: Iterable[int]) -> Dict[int, List[int]]:
+        """
+        將月份偏移量依目標年份分組。
+        
+        外部 API 以整年為單位提供資料，同一組的月份偏移量只需獲取一次資料。
+        
+        Args:
+            month_offsets (Iterable[int]): 月份偏移量
+        
+        Returns:
+            Dict[int, List[int]]: 以目標年份為鍵、該年份內的月份偏移量列表為值
+        
+        Examples:
+            >>> calculator = HolidayDateCalculator()
+            >>> sum(len(offsets) for offsets in calculator.group_offsets_by_year(range(12)).values())
+            12
+        
+        Raises:
+            ValueError: 當任一 month_offset 小於 0 或超過 MAX_MONTH_OFFSET 時
+        """
+        offsets_by_year: Dict[int, List[int]] = defaultdict(list)
+        for month_offset in month_offsets:
+            HolidayDateCalculator._validate_month_offset(month_offset)
+            target_year, _ = HolidayDateCalculator._resolve_target_month(month_offset)
+            offsets_by_year[target_year].append(month_offset)
+        return dict(offsets_by_year)
+
+    def prefetch_year(self, target_year: int, month_offsets: List[int]) -> bool:
+        """
+        獲取指定年份的節假日資料一次，並以暖機後的緩存預先產生各月份偏移量的響應。
+        
+        Args:
+            target_year (int): 目標年份
+            month_offsets (List[int]): 目標年份皆為 target_year 的月份偏移量，通常來自 group_offsets_by_year
+        
+        Returns:
+            bool: 資料已寫入緩存並產生響應時返回 True；外部 API 未成功回應時返回 False
+        
+        Examples:
+            >>> calculator = HolidayDateCalculator()
+            >>> offsets_by_year = calculator.group_offsets_by_year(range(12))
+            >>> all(calculator.prefetch_year(year, offsets) for year, offsets in offsets_by_year.items())
+            True
+        
+        Raises:
+            ValueError: 當任一 month_offset 小於 0 或超過 MAX_MONTH_OFFSET 時
+            requests.RequestException: 當無法獲取節假日數據時
+        """
+        _, first_month = HolidayDateCalculator._resolve_target_month(month_offsets[0])
+        self.data_fetcher.fetch_taiwan_holidays(target_year, first_month)
+        if not self.data_fetcher.cache.has_holiday_data_cache(target_year, first_month):
+            return False
+        
+        # 整年資料已在緩存中，以下只做本地計算與序列化
+        for month_offset in month_offsets:
+            self.calculate_dates_bytes(month_offset)
+        return True
+
+    def _get_result(self, target_year: int, target_month: int, month_offset: int) -> Dict[str, Any]:
+        """
+        取得指定目標年月與月份偏移量的計算結果，優先使用結果緩存。
+        
+        返回的可能是緩存中的字典本身，呼叫端不得修改。
+        
+        Args:
+            target_year (int): 目標年份
+            target_month (int): 目標月份（1-12）
+            month_offset (int): 月份偏移量，決定節假日的過濾規則
+        
+        Returns:
+            Dict[str, Any]: 格式同 calculate_dates 的計算結果
+        
+        Examples:
+            >>> calculator = HolidayDateCalculator()
+            >>> result = calculator._get_result(2025, 5, 2)
+            >>> result["target_month"]
+            5
+        
+        Raises:
+            requests.RequestException: 當無法獲取節假日數據時
+        """
+        # 結果只取決於目標年月與月份偏移量（過濾規則依偏移量而定）
+        cache_key = (target_year, target_month, month_offset)
+        cached_result = self._result_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
         
         # 獲取節假日數據
         try:
@@ -483,7 +770,7 @@ class HolidayDateCalculator(IHolidayDateCalculator):
             raise requests.RequestException(f"獲取節假日數據失敗：{e}")
         
         # 處理每個節假日
-        holiday_list = []
+        holiday_list: List[Dict[str, str]] = []
         for holiday in holidays_data:
             # 檢查是否應該跳過
             if not holiday.get('description'):
@@ -499,14 +786,100 @@ class HolidayDateCalculator(IHolidayDateCalculator):
             
             holiday_list.append({
                 "holiday_name": holiday.get('description', ''),
-                "holiday_date": datetime.strptime(holiday['date'], "%Y%m%d").strftime("%Y-%m-%d"),
+                "holiday_date": holiday.get('_date_iso') or _format_iso_date(holiday['date']),
                 "departure_date": dep_date.strftime("%Y-%m-%d"),
                 "return_date": ret_date.strftime("%Y-%m-%d"),
                 "weekday": holiday.get('week', '')
             })
         
-        return {
+        result = {
             "target_year": target_year,
             "target_month": target_month,
             "holidays": holiday_list
         }
+        
+        # 只有節假日資料已寫入緩存時才緩存結果，API 未成功回應時下次仍會重試
+        if self.data_fetcher.cache.has_holiday_data_cache(target_year, target_month):
+            self._result_cache[cache_key] = result
+        
+        return result
+
+    @staticmethod
+    def _validate_month_offset(month_offset: int) -> None:
+        """
+        檢查月份偏移量是否在允許範圍內。
+        
+        Args:
+            month_offset (int): 月份偏移量
+        
+        Returns:
+            None
+        
+        Examples:
+            >>> HolidayDateCalculator._validate_month_offset(2)
+            >>> HolidayDateCalculator._validate_month_offset(-1)
+            Traceback (most recent call last):
+                ...
+            ValueError: 月份偏移量必須為非負整數，目前值為 -1
+        
+        Raises:
+            ValueError: 當 month_offset 小於 0 或超過 MAX_MONTH_OFFSET 時
+        """
+        if month_offset < 0:
+            raise ValueError(f"月份偏移量必須為非負整數，目前值為 {month_offset}")
+        
+        if month_offset > MAX_MONTH_OFFSET:
+            raise ValueError(f"月份偏移量不得超過 {MAX_MONTH_OFFSET}，目前值為 {month_offset}")
+
+    @staticmethod
+    def _resolve_target_month(month_offset: int) -> tuple[int, int]:
+        """
+        根據月份偏移量計算目標年月。
+        
+        Args:
+            month_offset (int): 月份偏移量，表示從當前月份往後推幾個月
+        
+        Returns:
+            tuple[int, int]: (目標年份, 目標月份)
+        
+        Examples:
+            >>> year, month = HolidayDateCalculator._resolve_target_month(0)
+            >>> 1 <= month <= 12
+            True
+        
+        Raises:
+            不拋出異常
+        """
+        current_date = now_taipei()
+        
+        # 處理跨年情況
+        year_offset, month_index = divmod(current_date.month - 1 + month_offset, 12)
+        return current_date.year + year_offset, month_index + 1
+
+    @staticmethod
+    def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        複製計算結果，避免呼叫端修改到緩存內容。
+        
+        節假日項目的值皆為不可變的字串，因此複製每個項目字典即等同深層複製。
+        
+        Args:
+            result (Dict[str, Any]): calculate_dates 的計算結果
+        
+        Returns:
+            Dict[str, Any]: 與原結果內容相同的新字典
+        
+        Examples:
+            >>> result = {"target_year": 2025, "target_month": 1, "holidays": [{"holiday_name": "元旦"}]}
+            >>> copied = HolidayDateCalculator._copy_result(result)
+            >>> copied == result and copied["holidays"][0] is not result["holidays"][0]
+            True
+        
+        Raises:
+            不拋出異常
+        """
+        return {
+            "target_year": result["target_year"],
+            "target_month": result["target_month"],
+            "holidays": [dict(holiday) for holiday in result["holidays"]]
+        }
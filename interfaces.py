@@ -1,21 +1,20 @@
 """
 接口定義模組
 
-定義抽象基類，遵循依賴反轉原則（DIP）和接口隔離原則（ISP）。
+以 typing.Protocol 定義結構化接口，遵循依賴反轉原則（DIP）和接口隔離原則（ISP）。
+實現類別不需繼承接口，只要具備相同簽名的方法即符合接口。
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Protocol
 
 
-class IDateCalculator(ABC):
+class IDateCalculator(Protocol):
     """
     日期計算器基礎接口
     
-    定義日期計算的抽象接口，遵循依賴反轉原則。
+    定義日期計算的結構化接口，遵循依賴反轉原則。
     """
 
-    @abstractmethod
     def calculate_dates(self, **kwargs) -> Dict[str, Any]:
         """
         計算日期。
@@ -32,17 +31,16 @@ class IDateCalculator(ABC):
         Raises:
             ValueError: 當參數無效時
         """
-        pass
+        ...
 
 
-class IFixedMonthDateCalculator(IDateCalculator):
+class IFixedMonthDateCalculator(IDateCalculator, Protocol):
     """
     固定月份日期計算器接口
     
     用於固定月份日期計算的專用接口，遵循接口隔離原則。
     """
 
-    @abstractmethod
     def calculate_dates(self, month_offset: int, dep_day: int, return_day: int) -> Dict[str, str]:
         """
         根據月份偏移量和天數計算目標日期區間。
@@ -61,17 +59,36 @@ class IFixedMonthDateCalculator(IDateCalculator):
         Raises:
             ValueError: 當參數無效時
         """
-        pass
+        ...
+
+    def calculate_dates_unchecked(self, month_offset: int, dep_day: int, return_day: int) -> Dict[str, str]:
+        """
+        根據月份偏移量和天數計算目標日期區間，不重複檢查參數範圍。
+        
+        Args:
+            month_offset (int): 已驗證的月份偏移量
+            dep_day (int): 已驗證的出發日期天數
+            return_day (int): 已驗證的回程日期天數
+        
+        Returns:
+            Dict[str, str]: 包含計算後日期的字典
+        
+        Examples:
+            由具體實現類別提供
+        
+        Raises:
+            不拋出異常
+        """
+        ...
 
 
-class IHolidayDateCalculator(IDateCalculator):
+class IHolidayDateCalculator(IDateCalculator, Protocol):
     """
     節日日期計算器接口
     
     用於節日日期計算的專用接口，遵循接口隔離原則。
     """
 
-    @abstractmethod
     def calculate_dates(self, month_offset: int) -> Dict[str, Any]:
         """
         根據月份偏移量計算節假日日期區間。
@@ -88,18 +105,17 @@ class IHolidayDateCalculator(IDateCalculator):
         Raises:
             ValueError: 當參數無效時
         """
-        pass
+        ...
 
 
-class IDateValidator(ABC):
+class IDateValidator(Protocol):
     """
     日期驗證器接口
     
-    定義輸入驗證的抽象接口。
+    定義輸入驗證的結構化接口。
     """
 
-    @abstractmethod
-    def validate_input(self, data: Dict) -> tuple[bool, str]:
+    def validate_input(self, data: Dict) -> tuple[bool, str, Optional[tuple[int, int, int]]]:
         """
         驗證輸入數據的有效性。
         
@@ -107,7 +123,7 @@ class IDateValidator(ABC):
             data (Dict): 輸入數據
         
         Returns:
-            tuple[bool, str]: (是否有效, 錯誤訊息)
+            tuple[bool, str, Optional[tuple[int, int, int]]]: (是否有效, 錯誤訊息, 轉換後的參數)
         
         Examples:
             由具體實現類別提供
@@ -115,4 +131,4 @@ class IDateValidator(ABC):
         Raises:
             不拋出異常
         """
-        pass
+        ...
@@ -0,0 +1,46 @@
+"""
+台北時間模組
+
+提供帶有短期緩存的台北當前時間，供日期計算模組共用。
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from typing import Final
+import time
+
+
+# 台北時區，於模組載入時建立一次
+TAIPEI_TZ: Final[ZoneInfo] = ZoneInfo("Asia/Taipei")
+
+# 緩存有效秒數；日期計算只需要知道「目前是哪一個月」，60 秒的誤差可以接受
+_CACHE_TTL_SECONDS: Final[float] = 60.0
+
+# (緩存時的 monotonic 秒數, 緩存的台北時間)，以單一 tuple 整體替換，讀取端不需加鎖
+_cached_now: tuple[float, datetime | None] = (0.0, None)
+
+
+def now_taipei() -> datetime:
+    """
+    取得台北當前時間，60 秒內重複呼叫會返回同一個緩存值。
+    
+    Args:
+        無
+    
+    Returns:
+        datetime: 帶有 Asia/Taipei 時區資訊的當前時間
+    
+    Examples:
+        >>> now_taipei().tzinfo
+        zoneinfo.ZoneInfo(key='Asia/Taipei')
+    
+    Raises:
+        不拋出異常
+    """
+    global _cached_now
+    cached_at, cached_datetime = _cached_now
+    current = time.monotonic()
+    if cached_datetime is None or current - cached_at > _CACHE_TTL_SECONDS:
+        cached_datetime = datetime.now(TAIPEI_TZ)
+        _cached_now = (current, cached_datetime)
+    return cached_datetime
@@ -4,1183 +4,372 @@
 測試日期計算和驗證功能。
 """
 
+import calendar
+import json
 import pytest
+import threading
+import time
 from datetime import datetime
 from date_calculator import DateCalculator, DateValidator
+from holiday_calculator import (
+    HolidayDataCache, HolidayDataFetcher, HolidayDateCalculator, HolidayDateRangeCalculator, HolidayFilter
+)
+import app as app_module
 from app import app, DateAPIService
+from taipei_clock import TAIPEI_TZ, now_taipei
 
 
-class TestDateCalculator:
+# 測試模式只需在模組載入時設定一次
+app.config['TESTING'] = True
+
+# 有效的日期計算請求數據
+VALID_PAYLOAD = {"month_offset": 2, "dep_day": 5, "return_day": 10}
+
+# 測試使用的固定當前時間
+FROZEN_NOW = datetime(2025, 3, 15, 12, 0, tzinfo=TAIPEI_TZ)
+
+# 取代外部節假日 API 的固定回應，涵蓋 FROZEN_NOW 起算的數個月份
+_CANNED_HOLIDAYS = (
+    '['
+    '{"date": "20250101", "week": "三", "isHoliday": true, "description": "開國紀念日"},'
+    '{"date": "20250404", "week": "五", "isHoliday": true, "description": "兒童節"},'
+    '{"date": "20250501", "week": "四", "isHoliday": true, "description": "勞動節"},'
+    '{"date": "20250507", "week": "三", "isHoliday": true, "description": "測試假日"},'
+    '{"date": "20250531", "week": "六", "isHoliday": true, "description": "端午節"}'
+    ']'
+).encode('utf-8')
+
+
+class _FakeResponse:
     """
-    測試 DateCalculator 類別
+    模擬 requests.Response，只提供 HolidayDataFetcher 使用到的屬性。
     """
 
-    def setup_method(self):
-        """
-        設置測試環境。
-        
-        在每個測試方法執行前調用。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            自動在每個測試方法前執行
-        
-        Raises:
-            不拋出異常
-        """
-        self.calculator = DateCalculator()
+    def __init__(self, content: bytes, status_code: int = 200):
+        self.content = content
+        self.status_code = status_code
 
-    def test_calculate_dates_basic(self):
-        """
-        測試基本日期計算功能。
-        
-        驗證當輸入有效的月份偏移量和日期時，能正確計算目標日期。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestDateCalculator::test_calculate_dates_basic
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        result = self.calculator.calculate_dates(0, 15, 20)
-        
-        current_date = datetime.now()
-        expected_year = current_date.year
-        expected_month = current_date.month
-        
-        assert result["target_year"] == expected_year
-        assert result["target_month"] == expected_month
-        assert result["departure_date"] == f"{expected_year}-{expected_month:02d}-15"
-        assert result["return_date"] == f"{expected_year}-{expected_month:02d}-20"
 
-    def test_calculate_dates_with_offset(self):
-        """
-        測試帶月份偏移量的日期計算。
-        
-        驗證當輸入月份偏移量時，能正確計算未來月份的日期。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestDateCalculator::test_calculate_dates_with_offset
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        result = self.calculator.calculate_dates(2, 5, 10)
-        
-        current_date = datetime.now()
-        target_month = current_date.month + 2
-        target_year = current_date.year
-        
-        if target_month > 12:
-            target_month -= 12
-            target_year += 1
-        
-        assert result["target_year"] == target_year
-        assert result["target_month"] == target_month
-        assert result["departure_date"] == f"{target_year}-{target_month:02d}-05"
-        assert result["return_date"] == f"{target_year}-{target_month:02d}-10"
+class _FakeSession:
+    """
+    模擬 requests.Session，記錄呼叫次數並返回固定內容。
+    """
 
-    def test_calculate_dates_cross_year(self):
-        """
-        測試跨年的日期計算。
-        
-        驗證當月份偏移量導致跨年時，能正確處理年份變化。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestDateCalculator::test_calculate_dates_cross_year
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        result = self.calculator.calculate_dates(15, 5, 10)
-        
-        current_date = datetime.now()
-        target_month = current_date.month + 15
-        target_year = current_date.year
-        
-        while target_month > 12:
-            target_month -= 12
-            target_year += 1
-        
-        assert result["target_year"] == target_year
-        assert result["target_month"] == target_month
+    def __init__(self, content: bytes, delay_event: threading.Event = None):
+        self.content = content
+        self.delay_event = delay_event
+        self.call_count = 0
+        self._lock = threading.Lock()
 
-    def test_calculate_dates_exceeds_month_days(self):
-        """
-        測試日期超過月份天數的情況。
-        
-        驗證當輸入的日期天數超過目標月份的最大天數時，能自動調整為該月份的最後一天。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestDateCalculator::test_calculate_dates_exceeds_month_days
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        # 2月最多29天（閏年）或28天
-        result = self.calculator.calculate_dates(1, 31, 31)
-        
-        # 驗證日期不會超過該月份的最大天數
-        dep_date_parts = result["departure_date"].split("-")
-        return_date_parts = result["return_date"].split("-")
-        
-        assert int(dep_date_parts[2]) <= 31
-        assert int(return_date_parts[2]) <= 31
+    def get(self, url, timeout=None):
+        with self._lock:
+            self.call_count += 1
+        if self.delay_event is not None:
+            self.delay_event.wait(timeout=5)
+        return _FakeResponse(self.content)
 
-    def test_calculate_dates_negative_offset(self):
-        """
-        測試負數月份偏移量的錯誤處理。
-        
-        驗證當輸入負數月份偏移量時，拋出 ValueError。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestDateCalculator::test_calculate_dates_negative_offset
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        with pytest.raises(ValueError) as exc_info:
-            self.calculator.calculate_dates(-1, 5, 10)
-        
-        assert "月份偏移量必須為非負整數" in str(exc_info.value)
 
-    def test_calculate_dates_invalid_dep_day(self):
-        """
-        測試無效出發日期的錯誤處理。
-        
-        驗證當出發日期超出範圍時，拋出 ValueError。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestDateCalculator::test_calculate_dates_invalid_dep_day
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        with pytest.raises(ValueError) as exc_info:
-            self.calculator.calculate_dates(2, 0, 10)
-        
-        assert "出發日期天數必須在 1-31 之間" in str(exc_info.value)
+def _canned_holiday_calculator() -> HolidayDateCalculator:
+    """
+    建立以固定回應取代外部 API 的節日日期計算器。
+    
+    使用獨立的緩存，不會與其他測試或共享緩存互相影響。
+    
+    Args:
+        無
+    
+    Returns:
+        HolidayDateCalculator: 節日日期計算器實例
+    
+    Examples:
+        >>> calculator = _canned_holiday_calculator()
+    
+    Raises:
+        不拋出異常
+    """
+    return HolidayDateCalculator(
+        data_fetcher=HolidayDataFetcher(cache=HolidayDataCache({}), session=_FakeSession(_CANNED_HOLIDAYS))
+    )
 
-    def test_calculate_dates_invalid_return_day(self):
-        """
-        測試無效回程日期的錯誤處理。
-        
-        驗證當回程日期超出範圍時，拋出 ValueError。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestDateCalculator::test_calculate_dates_invalid_return_day
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        with pytest.raises(ValueError) as exc_info:
-            self.calculator.calculate_dates(2, 5, 32)
-        
-        assert "回程日期天數必須在 1-31 之間" in str(exc_info.value)
 
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    """
+    將日期與節日計算器的當前時間固定為 FROZEN_NOW。
+    
+    讓預期結果可以直接寫成常數，不需在測試中重算目標年月。
+    
+    Args:
+        monkeypatch: pytest 的 monkeypatch fixture
+    
+    Returns:
+        None
+    
+    Examples:
+        自動套用在每個測試
+    
+    Raises:
+        不拋出異常
+    """
+    monkeypatch.setattr("date_calculator.now_taipei", lambda: FROZEN_NOW)
+    monkeypatch.setattr("holiday_calculator.now_taipei", lambda: FROZEN_NOW)
 
-class TestDateValidator:
+
+@pytest.fixture(autouse=True)
+def stub_holiday_api(monkeypatch):
     """
-    測試 DateValidator 類別
+    將 API 使用的節日日期計算器替換為讀取固定回應的版本。
+    
+    避免 /calculate_holiday_dates 的測試連線到外部節假日 API。
+    
+    Args:
+        monkeypatch: pytest 的 monkeypatch fixture
+    
+    Returns:
+        None
+    
+    Examples:
+        自動套用在每個測試
+    
+    Raises:
+        不拋出異常
     """
+    monkeypatch.setattr(app_module, "holiday_calculator", _canned_holiday_calculator())
 
-    def setup_method(self):
-        """
-        設置測試環境。
-        
-        在每個測試方法執行前調用。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            自動在每個測試方法前執行
-        
-        Raises:
-            不拋出異常
-        """
-        self.validator = DateValidator()
 
-    def test_validate_input_valid(self):
-        """
-        測試有效輸入的驗證。
-        
-        驗證當所有參數都有效時，返回 True。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestDateValidator::test_validate_input_valid
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        data = {
-            "month_offset": 2,
-            "dep_day": 5,
-            "return_day": 10
-        }
-        
-        is_valid, error = self.validator.validate_input(data)
-        assert is_valid is True
-        assert error == ""
+@pytest.fixture
+def make_payload():
+    """
+    提供建立日期計算請求數據的函式。
+    
+    以有效的請求數據為基礎，測試只需指定要省略的欄位或要覆寫的值。
+    
+    Args:
+        無
+    
+    Returns:
+        Callable[..., Dict]: 接受要省略的欄位名稱與要覆寫的欄位值，返回新的請求數據字典
+    
+    Examples:
+        >>> make_payload("return_day", month_offset=-1)
+        {'month_offset': -1, 'dep_day': 5}
+    
+    Raises:
+        不拋出異常
+    """
+    def build(*omit, **overrides):
+        data = {**VALID_PAYLOAD, **overrides}
+        for field in omit:
+            del data[field]
+        return data
+    return build
 
-    def test_validate_input_missing_fields(self):
-        """
-        測試缺少必要欄位的驗證。
-        
-        驗證當缺少必要參數時，返回 False 和錯誤訊息。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestDateValidator::test_validate_input_missing_fields
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        data = {
-            "month_offset": 2,
-            "dep_day": 5
-        }
-        
-        is_valid, error = self.validator.validate_input(data)
-        assert is_valid is False
-        assert "缺少必要參數" in error
 
-    def test_validate_input_invalid_type(self):
-        """
-        測試無效數據類型的驗證。
-        
-        驗證當參數類型錯誤時，返回 False 和錯誤訊息。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestDateValidator::test_validate_input_invalid_type
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        data = {
-            "month_offset": "invalid",
-            "dep_day": 5,
-            "return_day": 10
-        }
-        
-        is_valid, error = self.validator.validate_input(data)
-        assert is_valid is False
-        assert "參數必須為整數類型" in error
+@pytest.fixture(scope="session")
+def client():
+    """
+    建立整個測試階段共用的 Flask 測試客戶端。
+    
+    Flask 的測試客戶端可重複發送請求，所有 API 測試共用同一個實例。
+    
+    Args:
+        無
+    
+    Returns:
+        FlaskClient: Flask 測試客戶端
+    
+    Examples:
+        在測試方法中作為參數使用
+    
+    Raises:
+        不拋出異常
+    """
+    return app.test_client()
 
-    def test_validate_input_negative_offset(self):
-        """
-        測試負數月份偏移量的驗證。
-        
-        驗證當月份偏移量為負數時，返回 False 和錯誤訊息。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestDateValidator::test_validate_input_negative_offset
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        data = {
-            "month_offset": -1,
-            "dep_day": 5,
-            "return_day": 10
-        }
-        
-        is_valid, error = self.validator.validate_input(data)
-        assert is_valid is False
-        assert "month_offset 必須為非負整數" in error
 
-    def test_validate_input_invalid_day_range(self):
-        """
-        測試日期範圍超出的驗證。
-        
-        驗證當日期天數超出 1-31 範圍時，返回 False 和錯誤訊息。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestDateValidator::test_validate_input_invalid_day_range
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        data = {
-            "month_offset": 2,
-            "dep_day": 0,
-            "return_day": 10
-        }
-        
-        is_valid, error = self.validator.validate_input(data)
-        assert is_valid is False
-        assert "dep_day 必須在 1-31 之間" in error
+@pytest.fixture(scope="class")
+def date_calculator():
+    """
+    建立每個測試類別共用的日期計算器。
+    
+    DateCalculator 不保存狀態，同一測試類別只需建立一次。
+    
+    Args:
+        無
+    
+    Returns:
+        DateCalculator: 日期計算器實例
+    
+    Examples:
+        在測試方法中作為參數使用
+    
+    Raises:
+        不拋出異常
+    """
+    return DateCalculator()
 
 
-class TestFlaskAPI:
+@pytest.fixture(scope="class")
+def service():
     """
-    測試 Flask API 端點
+    建立每個測試類別共用的日期 API 服務。
+    
+    DateCalculator 與 DateValidator 皆不保存狀態，同一測試類別只需建立一次。
+    
+    Args:
+        無
+    
+    Returns:
+        DateAPIService: 日期 API 服務實例
+    
+    Examples:
+        在測試方法中作為參數使用
+    
+    Raises:
+        不拋出異常
     """
-
-    @pytest.fixture
-    def client(self):
-        """
-        創建 Flask 測試客戶端。
-        
-        用於測試 API 端點。
-        
-        Args:
-            無
-        
-        Returns:
-            FlaskClient: Flask 測試客戶端
-        
-        Examples:
-            在測試方法中作為參數使用
-        
-        Raises:
-            不拋出異常
-        """
-        app.config['TESTING'] = True
-        with app.test_client() as client:
-            yield client
-
-    def test_calculate_dates_endpoint_success(self, client):
-        """
-        測試成功的日期計算 API 請求。
-        
-        驗證 POST /calculate_dates 端點在有效輸入下返回正確結果。
-        
-        Args:
-            client: Flask 測試客戶端
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestFlaskAPI::test_calculate_dates_endpoint_success
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        response = client.post(
-            '/calculate_dates',
-            json={
-                "month_offset": 2,
-                "dep_day": 5,
-                "return_day": 10
-            }
-        )
-        
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["success"] is True
-        assert "data" in data
-        assert "departure_date" in data["data"]
-        assert "return_date" in data["data"]
-        assert "target_year" in data["data"]
-        assert "target_month" in data["data"]
-
-    def test_calculate_dates_endpoint_missing_params(self, client):
-        """
-        測試缺少參數的 API 請求。
-        
-        驗證當缺少必要參數時，API 返回 400 錯誤。
-        
-        Args:
-            client: Flask 測試客戶端
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestFlaskAPI::test_calculate_dates_endpoint_missing_params
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        response = client.post(
-            '/calculate_dates',
-            json={
-                "month_offset": 2,
-                "dep_day": 5
-            }
-        )
-        
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "error" in data
-
-    def test_calculate_dates_endpoint_invalid_json(self, client):
-        """
-        測試無效 JSON 格式的 API 請求。
-        
-        驗證當請求體不是 JSON 格式時，API 返回錯誤（415 或 400）。
-        
-        Args:
-            client: Flask 測試客戶端
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestFlaskAPI::test_calculate_dates_endpoint_invalid_json
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        response = client.post(
-            '/calculate_dates',
-            data="invalid json"
-        )
-        
-        # Flask 對於非 JSON 內容類型返回 415 Unsupported Media Type
-        assert response.status_code in [400, 415]
-
-    def test_calculate_dates_endpoint_negative_offset(self, client):
-        """
-        測試負數月份偏移量的 API 請求。
-        
-        驗證當月份偏移量為負數時，API 返回 400 錯誤。
-        
-        Args:
-            client: Flask 測試客戶端
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestFlaskAPI::test_calculate_dates_endpoint_negative_offset
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        response = client.post(
-            '/calculate_dates',
-            json={
-                "month_offset": -1,
-                "dep_day": 5,
-                "return_day": 10
-            }
-        )
-        
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "error" in data
-
-    def test_health_endpoint(self, client):
-        """
-        測試健康檢查端點。
-        
-        驗證 GET /health 端點返回正確的健康狀態。
-        
-        Args:
-            client: Flask 測試客戶端
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestFlaskAPI::test_health_endpoint
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        response = client.get('/health')
-        
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["status"] == "healthy"
-
-
-class TestDateAPIService:
-    """
-    測試 DateAPIService 類別
-    """
-
-    def setup_method(self):
-        """
-        設置測試環境。
-        
-        在每個測試方法執行前調用。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            自動在每個測試方法前執行
-        
-        Raises:
-            不拋出異常
-        """
-        self.service = DateAPIService(DateCalculator(), DateValidator())
-
-    def test_process_request_success(self):
-        """
-        測試成功處理請求。
-        
-        驗證服務能正確處理有效的請求數據。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestDateAPIService::test_process_request_success
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        data = {
-            "month_offset": 2,
-            "dep_day": 5,
-            "return_day": 10
-        }
-        
-        response, status_code = self.service.process_request(data)
-        
-        assert status_code == 200
-        assert response["success"] is True
-        assert "data" in response
-
-    def test_process_request_validation_error(self):
-        """
-        測試驗證錯誤的處理。
-        
-        驗證服務能正確處理驗證失敗的情況。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestDateAPIService::test_process_request_validation_error
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        data = {
-            "month_offset": -1,
-            "dep_day": 5,
-            "return_day": 10
-        }
-        
-        response, status_code = self.service.process_request(data)
-        
-        assert status_code == 400
-        assert "error" in response
-
-
-class TestHolidayDateCalculator:
-    """
-    測試 HolidayDateCalculator 類別
-    """
-
-    def setup_method(self):
-        """
-        設置測試環境。
-        
-        在每個測試方法執行前調用。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            自動在每個測試方法前執行
-        
-        Raises:
-            不拋出異常
-        """
-        from holiday_calculator import HolidayDateCalculator
-        self.calculator = HolidayDateCalculator()
-
-    def test_calculate_dates_basic(self):
-        """
-        測試基本節日日期計算功能。
-        
-        驗證當輸入有效的月份偏移量時，能返回正確的結構。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayDateCalculator::test_calculate_dates_basic
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        result = self.calculator.calculate_dates(2)
-        
-        assert "target_year" in result
-        assert "target_month" in result
-        assert "holidays" in result
-        assert isinstance(result["holidays"], list)
-
-    def test_calculate_dates_negative_offset(self):
-        """
-        測試負數月份偏移量的錯誤處理。
-        
-        驗證當輸入負數月份偏移量時，拋出 ValueError。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayDateCalculator::test_calculate_dates_negative_offset
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        with pytest.raises(ValueError) as exc_info:
-            self.calculator.calculate_dates(-1)
-        
-        assert "月份偏移量必須為非負整數" in str(exc_info.value)
+    return DateAPIService(DateCalculator(), DateValidator())
 
 
-class TestHolidayFilter:
+@pytest.fixture(scope="class")
+def holiday_date_calculator():
     """
-    測試 HolidayFilter 類別
+    建立每個測試類別共用的節日日期計算器。
+    
+    Args:
+        無
+    
+    Returns:
+        HolidayDateCalculator: 讀取固定回應的節日日期計算器實例
+    
+    Examples:
+        在測試方法中作為參數使用
+    
+    Raises:
+        不拋出異常
     """
-
-    def setup_method(self):
-        """
-        設置測試環境。
-        
-        在每個測試方法執行前調用。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            自動在每個測試方法前執行
-        
-        Raises:
-            不拋出異常
-        """
-        from holiday_calculator import HolidayFilter
-        self.filter = HolidayFilter()
-
-    def test_should_skip_spring_festival(self):
-        """
-        測試春節過濾。
-        
-        驗證春節應該被過濾掉。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayFilter::test_should_skip_spring_festival
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        holiday = {'description': '春節', 'date': '20250129'}
-        assert self.filter.should_skip_holiday(holiday, 2) is True
-
-    def test_should_skip_lunar_new_year_eve(self):
-        """
-        測試農曆除夕過濾。
-        
-        驗證農曆除夕應該被過濾掉。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayFilter::test_should_skip_lunar_new_year_eve
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        holiday = {'description': '農曆除夕', 'date': '20250128'}
-        assert self.filter.should_skip_holiday(holiday, 2) is True
-
-    def test_should_skip_fixed_range_month2(self):
-        """
-        測試2個月後固定區間過濾。
-        
-        驗證2個月後的5-10號應該被過濾掉。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayFilter::test_should_skip_fixed_range_month2
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        holiday = {'description': '端午節', 'date': '20251207'}
-        assert self.filter.should_skip_holiday(holiday, 2) is True
-
-    def test_should_not_skip_normal_holiday(self):
-        """
-        測試正常節日不應被過濾。
-        
-        驗證正常的節日不應該被過濾掉。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayFilter::test_should_not_skip_normal_holiday
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        holiday = {'description': '元旦', 'date': '20260101'}
-        assert self.filter.should_skip_holiday(holiday, 3) is False
+    return _canned_holiday_calculator()
 
 
-class TestHolidayDateRangeCalculator:
+@pytest.fixture(scope="class")
+def holiday_filter():
     """
-    測試 HolidayDateRangeCalculator 類別
+    建立每個測試類別共用的節日過濾器。
+    
+    Args:
+        無
+    
+    Returns:
+        HolidayFilter: 節日過濾器實例
+    
+    Examples:
+        在測試方法中作為參數使用
+    
+    Raises:
+        不拋出異常
     """
+    return HolidayFilter()
 
-    def setup_method(self):
-        """
-        設置測試環境。
-        
-        在每個測試方法執行前調用。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            自動在每個測試方法前執行
-        
-        Raises:
-            不拋出異常
-        """
-        from holiday_calculator import HolidayDateRangeCalculator
-        self.calculator = HolidayDateRangeCalculator()
-
-    def test_calculate_date_range_general_monday(self):
-        """
-        測試一般週一假日的日期範圍計算。
-        
-        驗證週一假日的出發和回程日期計算正確（前4天到當天）。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_general_monday
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        from datetime import datetime
-        holiday = {'date': '20260105', 'week': '一', 'description': '測試假日'}
-        dep, ret = self.calculator.calculate_date_range(holiday)
-        
-        # 週一假日：前4天到當天 (-4, 0)
-        assert dep == datetime(2026, 1, 1)
-        assert ret == datetime(2026, 1, 5)
-
-    def test_calculate_date_range_general_tuesday(self):
-        """
-        測試一般週二假日的日期範圍計算。
-        
-        驗證週二假日的出發和回程日期計算正確（前4天到當天）。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_general_tuesday
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        from datetime import datetime
-        holiday = {'date': '20260106', 'week': '二', 'description': '測試假日'}
-        dep, ret = self.calculator.calculate_date_range(holiday)
-        
-        # 週二假日：前4天到當天 (-4, 0)
-        assert dep == datetime(2026, 1, 2)
-        assert ret == datetime(2026, 1, 6)
-
-    def test_calculate_date_range_general_wednesday(self):
-        """
-        測試一般週三假日的日期範圍計算。
-        
-        驗證週三假日的出發和回程日期計算正確（當天到後3天）。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_general_wednesday
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        from datetime import datetime
-        holiday = {'date': '20260107', 'week': '三', 'description': '測試假日'}
-        dep, ret = self.calculator.calculate_date_range(holiday)
-        
-        # 週三假日：當天到後3天 (0, 3)
-        assert dep == datetime(2026, 1, 7)
-        assert ret == datetime(2026, 1, 10)
-
-    def test_calculate_date_range_general_thursday(self):
-        """
-        測試一般週四假日的日期範圍計算。
-        
-        驗證週四假日的出發和回程日期計算正確（前1天到後3天）。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_general_thursday
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        from datetime import datetime
-        holiday = {'date': '20260108', 'week': '四', 'description': '測試假日'}
-        dep, ret = self.calculator.calculate_date_range(holiday)
-        
-        # 週四假日：前1天到後3天 (-1, 3)
-        assert dep == datetime(2026, 1, 7)
-        assert ret == datetime(2026, 1, 11)
-
-    def test_calculate_date_range_general_friday(self):
-        """
-        測試一般週五假日的日期範圍計算。
-        
-        驗證週五假日的出發和回程日期計算正確（前2天到後2天）。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_general_friday
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        from datetime import datetime
-        holiday = {'date': '20260109', 'week': '五', 'description': '測試假日'}
-        dep, ret = self.calculator.calculate_date_range(holiday)
-        
-        # 週五假日：前2天到後2天 (-2, 2)
-        assert dep == datetime(2026, 1, 7)
-        assert ret == datetime(2026, 1, 11)
-
-    def test_calculate_date_range_general_saturday(self):
-        """
-        測試一般週六假日的日期範圍計算。
-        
-        驗證週六假日的出發和回程日期計算正確（前3天到後1天）。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_general_saturday
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        from datetime import datetime
-        holiday = {'date': '20260110', 'week': '六', 'description': '測試假日'}
-        dep, ret = self.calculator.calculate_date_range(holiday)
-        
-        # 週六假日：前3天到後1天 (-3, 1)
-        assert dep == datetime(2026, 1, 7)
-        assert ret == datetime(2026, 1, 11)
-
-    def test_calculate_date_range_general_sunday(self):
-        """
-        測試一般週日假日的日期範圍計算。
-        
-        驗證週日假日的出發和回程日期計算正確（前4天到當天）。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_general_sunday
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        from datetime import datetime
-        holiday = {'date': '20260111', 'week': '日', 'description': '測試假日'}
-        dep, ret = self.calculator.calculate_date_range(holiday)
-        
-        # 週日假日：前4天到當天 (-4, 0)
-        assert dep == datetime(2026, 1, 7)
-        assert ret == datetime(2026, 1, 11)
-
-    def test_calculate_date_range_founding_day_wednesday(self):
-        """
-        測試開國紀念日在週三的特殊規則。
-        
-        驗證開國紀念日在週三時，使用特殊計算規則（前4天到當天）。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_founding_day_wednesday
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        from datetime import datetime
-        holiday = {'date': '20250101', 'week': '三', 'description': '開國紀念日'}
-        dep, ret = self.calculator.calculate_date_range(holiday)
-        
-        # 開國紀念日在週三：前4天到當天（特殊規則）
-        assert dep == datetime(2024, 12, 28)
-        assert ret == datetime(2025, 1, 1)
 
-    def test_calculate_date_range_lunar_new_year_monday(self):
-        """
-        測試小年夜在週一的日期範圍計算。
-        
-        驗證小年夜在週一時的計算規則（前2天到後4天）。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_lunar_new_year_monday
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        from datetime import datetime
-        holiday = {'date': '20260126', 'week': '一', 'description': '小年夜'}
-        dep, ret = self.calculator.calculate_date_range(holiday)
-        
-        # 小年夜在週一：前2天到後4天 (-2, 4)
-        assert dep == datetime(2026, 1, 24)
-        assert ret == datetime(2026, 1, 30)
+@pytest.fixture(scope="class")
+def range_calculator():
+    """
+    建立每個測試類別共用的日期範圍計算器。
+    
+    Args:
+        無
+    
+    Returns:
+        HolidayDateRangeCalculator: 日期範圍計算器實例
+    
+    Examples:
+        在測試方法中作為參數使用
+    
+    Raises:
+        不拋出異常
+    """
+    return HolidayDateRangeCalculator()
 
-    def test_calculate_date_range_lunar_new_year_tuesday(self):
-        """
-        測試小年夜在週二的日期範圍計算。
-        
-        驗證小年夜在週二時的計算規則（前3天到後3天）。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_lunar_new_year_tuesday
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        from datetime import datetime
-        holiday = {'date': '20250128', 'week': '二', 'description': '小年夜'}
-        dep, ret = self.calculator.calculate_date_range(holiday)
-        
-        # 小年夜在週二：前3天到後3天 (-3, 3)
-        assert dep == datetime(2025, 1, 25)
-        assert ret == datetime(2025, 1, 31)
 
-    def test_calculate_date_range_lunar_new_year_wednesday(self):
-        """
-        測試小年夜在週三的日期範圍計算。
-        
-        驗證小年夜在週三時的計算規則（前4天到後2天）。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_lunar_new_year_wednesday
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        from datetime import datetime
-        holiday = {'date': '20270210', 'week': '三', 'description': '小年夜'}
-        dep, ret = self.calculator.calculate_date_range(holiday)
-        
-        # 小年夜在週三：前4天到後2天 (-4, 2)
-        assert dep == datetime(2027, 2, 6)
-        assert ret == datetime(2027, 2, 12)
+class TestDateCalculator:
+    """
+    測試 DateCalculator 類別
+    """
 
-    def test_calculate_date_range_lunar_new_year_thursday(self):
-        """
-        測試小年夜在週四的日期範圍計算。
-        
-        驗證小年夜在週四時的計算規則（前2天到後4天）。
-        
-        Args:
-            無
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_lunar_new_year_thursday
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        from datetime import datetime
-        holiday = {'date': '20280127', 'week': '四', 'description': '小年夜'}
-        dep, ret = self.calculator.calculate_date_range(holiday)
+    def test_calculate_dates_basic(self, date_calculator):
+        """測試基本日期計算功能。"""
+        result = date_calculator.calculate_dates(0, 15, 20)
+        
+        assert result["target_year"] == 2025
+        assert result["target_month"] == 3
+        assert result["departure_date"] == "2025-03-15"
+        assert result["return_date"] == "2025-03-20"
+
+    def test_calculate_dates_with_offset(self, date_calculator):
+        """測試帶月份偏移量的日期計算。"""
+        result = date_calculator.calculate_dates(2, 5, 10)
+        
+        assert result["target_year"] == 2025
+        assert result["target_month"] == 5
+        assert result["departure_date"] == "2025-05-05"
+        assert result["return_date"] == "2025-05-10"
+
+    def test_calculate_dates_cross_year(self, date_calculator):
+        """測試跨年的日期計算。"""
+        # 2025 年 3 月往後 15 個月為 2026 年 6 月
+        result = date_calculator.calculate_dates(15, 5, 10)
+        
+        assert result["target_year"] == 2026
+        assert result["target_month"] == 6
+
+    def test_calculate_dates_exceeds_month_days(self, date_calculator):
+        """測試日期超過月份天數的情況。"""
+        # 2025 年 4 月只有 30 天
+        result = date_calculator.calculate_dates(1, 31, 31)
+        
+        # 驗證日期被調整為該月份的最後一天
+        _, max_day = calendar.monthrange(result["target_year"], result["target_month"])
+        expected_date = f"{result['target_year']}-{result['target_month']:02d}-{max_day:02d}"
+        
+        assert result["departure_date"] == expected_date
+        assert result["return_date"] == expected_date
+
+    @pytest.mark.parametrize("args, message", [
+        ((-1, 5, 10), "月份偏移量必須為非負整數"),
+        ((2, 0, 10), "出發日期天數必須在 1-31 之間"),
+        ((2, 5, 32), "回程日期天數必須在 1-31 之間"),
+        ((1201, 5, 10), "月份偏移量不得超過 1200"),
+    ], ids=["negative_offset", "invalid_dep_day", "invalid_return_day", "offset_too_large"])
+    def test_calculate_dates_invalid_args(self, date_calculator, args, message):
+        """測試無效參數的錯誤處理。"""
+        with pytest.raises(ValueError, match=message):
+            date_calculator.calculate_dates(*args)
+
+
+class TestTaipeiClock:
+    """
+    測試 taipei_clock 模組
+    """
+
+    def test_now_taipei_is_cached(self):
+        """測試台北當前時間的緩存。"""
+        first = now_taipei()
+        second = now_taipei()
         
-        # 小年夜在週四：前2天到後4天 (-2, 4)
-        assert dep == datetime(2028, 1, 25)
-        assert ret == datetime(2028, 1, 31)
+        assert first is second
+        assert first.utcoffset().total_seconds() == 8 * 3600
 
-    def test_calculate_date_range_lunar_new_year_friday(self):
+
+class TestDateValidator:
+    """
+    測試 DateValidator 類別
+    """
+
+    def setup_method(self):
         """
-        測試小年夜在週五的日期範圍計算。
+        設置測試環境。
         
-        驗證小年夜在週五時的計算規則（前2天到後4天）。
+        在每個測試方法執行前調用。
         
         Args:
             無
@@ -1189,95 +378,376 @@ class TestHolidayDateRangeCalculator:
             None
         
         Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_lunar_new_year_friday
+            自動在每個測試方法前執行
         
         Raises:
-            AssertionError: 當測試失敗時
+            不拋出異常
         """
-        from datetime import datetime
-        holiday = {'date': '20290216', 'week': '五', 'description': '小年夜'}
-        dep, ret = self.calculator.calculate_date_range(holiday)
-        
-        # 小年夜在週五：前2天到後4天 (-2, 4)
-        assert dep == datetime(2029, 2, 14)
-        assert ret == datetime(2029, 2, 20)
+        self.validator = DateValidator()
 
-    def test_calculate_date_range_lunar_new_year_saturday(self):
-        """
-        測試小年夜在週六的日期範圍計算。
-        
-        驗證小年夜在週六時的計算規則（前2天到後3天）。
-        
-        Args:
-            無
+    def test_validate_input_valid(self, make_payload):
+        """測試有效輸入的驗證。"""
+        is_valid, error, parsed = self.validator.validate_input(make_payload())
+        assert is_valid is True
+        assert error == ""
+        assert parsed == (2, 5, 10)
+
+    @pytest.mark.parametrize("omit, overrides, message", [
+        (("return_day",), {}, "缺少必要參數"),
+        ((), {"month_offset": "invalid"}, "參數必須為整數類型"),
+        ((), {"month_offset": -1}, "month_offset 必須為非負整數"),
+        ((), {"dep_day": 0}, "dep_day 必須在 1-31 之間"),
+        ((), {"month_offset": 10 ** 21}, "month_offset 必須為非負整數且不超過 1200"),
+        ((), {"month_offset": float("inf")}, "參數必須為整數類型"),
+    ], ids=["missing_fields", "invalid_type", "negative_offset", "invalid_day_range", "offset_too_large", "infinite_offset"])
+    def test_validate_input_invalid(self, make_payload, omit, overrides, message):
+        """測試無效輸入的驗證。"""
+        is_valid, error, parsed = self.validator.validate_input(make_payload(*omit, **overrides))
+        assert is_valid is False
+        assert parsed is None
+        assert message in error
+
+
+class TestFlaskAPI:
+    """
+    測試 Flask API 端點
+    """
+
+    def test_calculate_dates_endpoint_success(self, client, make_payload):
+        """測試成功的日期計算 API 請求。"""
+        response = client.post('/calculate_dates', json=make_payload())
         
-        Returns:
-            None
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["success"] is True
+        assert "data" in data
+        assert "departure_date" in data["data"]
+        assert "return_date" in data["data"]
+        assert "target_year" in data["data"]
+        assert "target_month" in data["data"]
+
+    def test_calculate_dates_endpoint_invalid_json(self, client):
+        """測試無效 JSON 格式的 API 請求。"""
+        response = client.post(
+            '/calculate_dates',
+            data="invalid json"
+        )
         
-        Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_lunar_new_year_saturday
+        # 以 get_json(silent=True) 解析，非 JSON 內容類型與無法解析的內容皆返回 400
+        assert response.status_code == 400
+        assert "error" in response.get_json()
+
+    @pytest.mark.parametrize("payload", [
+        {"month_offset": 2, "dep_day": 5},
+        [2, 5, 10],
+        {"month_offset": -1, "dep_day": 5, "return_day": 10},
+        {"month_offset": 10 ** 21, "dep_day": 5, "return_day": 10},
+        {"month_offset": float("inf"), "dep_day": 5, "return_day": 10},
+    ], ids=["missing_params", "non_object_json", "negative_offset", "offset_too_large", "infinite_offset"])
+    def test_calculate_dates_endpoint_bad_request(self, client, payload):
+        """測試缺少參數、請求體不是物件或參數無效的 API 請求返回 400 錯誤。"""
+        response = client.post('/calculate_dates', json=payload)
         
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        from datetime import datetime
-        holiday = {'date': '20300202', 'week': '六', 'description': '小年夜'}
-        dep, ret = self.calculator.calculate_date_range(holiday)
+        assert response.status_code == 400
+        data = response.get_json()
+        assert "error" in data
+
+    def test_health_endpoint(self, client):
+        """測試健康檢查端點。"""
+        response = client.get('/health')
         
-        # 小年夜在週六：前2天到後3天 (-2, 3)
-        assert dep == datetime(2030, 1, 31)
-        assert ret == datetime(2030, 2, 5)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["status"] == "healthy"
 
-    def test_calculate_date_range_lunar_new_year_sunday(self):
-        """
-        測試小年夜在週日的日期範圍計算。
+
+class TestDateAPIService:
+    """
+    測試 DateAPIService 類別
+    """
+
+    def test_process_request_success(self, service, make_payload):
+        """測試成功處理請求。"""
+        response, status_code = service.process_request(make_payload())
         
-        驗證小年夜在週日時的計算規則（前2天到後3天）。
+        assert status_code == 200
+        assert response["success"] is True
+        assert "data" in response
+
+    def test_process_request_validation_error(self, service, make_payload):
+        """測試驗證錯誤的處理。"""
+        response, status_code = service.process_request(make_payload(month_offset=-1))
         
-        Args:
-            無
+        assert status_code == 400
+        assert "error" in response
+
+
+class TestHolidayDateCalculator:
+    """
+    測試 HolidayDateCalculator 類別
+    """
+
+    def test_calculate_dates_basic(self, holiday_date_calculator):
+        """測試基本節日日期計算功能。"""
+        result = holiday_date_calculator.calculate_dates(2)
+        
+        assert result["target_year"] == 2025
+        assert result["target_month"] == 5
+        # 5-10 號的假日在 2 個月後會被過濾掉
+        assert [holiday["holiday_name"] for holiday in result["holidays"]] == ["勞動節", "端午節"]
+        assert result["holidays"][0] == {
+            "holiday_name": "勞動節",
+            "holiday_date": "2025-05-01",
+            "departure_date": "2025-04-30",
+            "return_date": "2025-05-04",
+            "weekday": "四"
+        }
+
+    def test_calculate_dates_negative_offset(self, holiday_date_calculator):
+        """測試負數月份偏移量的錯誤處理。"""
+        with pytest.raises(ValueError, match="月份偏移量必須為非負整數"):
+            holiday_date_calculator.calculate_dates(-1)
+
+    def test_calculate_dates_offset_too_large(self, holiday_date_calculator):
+        """測試超過上限的月份偏移量的錯誤處理。"""
+        with pytest.raises(ValueError, match="月份偏移量不得超過 1200"):
+            holiday_date_calculator.calculate_dates(1201)
+
+    def test_calculate_dates_result_is_cached(self):
+        """測試同一目標年月的計算結果會被緩存。"""
+        class CountingRangeCalculator(HolidayDateRangeCalculator):
+            calls = 0
+            
+            def calculate_date_range(self, holiday):
+                CountingRangeCalculator.calls += 1
+                return super().calculate_date_range(holiday)
+        
+        content = '[{"date": "20250317", "week": "一", "isHoliday": true, "description": "測試假日"}]'.encode('utf-8')
+        calculator = HolidayDateCalculator(
+            data_fetcher=HolidayDataFetcher(cache=HolidayDataCache({}), session=_FakeSession(content)),
+            range_calculator=CountingRangeCalculator()
+        )
         
-        Returns:
-            None
+        first = calculator.calculate_dates(0)
+        first["holidays"].clear()
+        second = calculator.calculate_dates(0)
         
-        Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_lunar_new_year_sunday
+        assert CountingRangeCalculator.calls == 1
+        assert len(second["holidays"]) == 1
+        assert second["holidays"][0]["holiday_name"] == "測試假日"
+
+    def test_calculate_dates_bytes_is_cached(self):
+        """測試已序列化的 API 響應會被緩存。"""
+        content = '[{"date": "20250317", "week": "一", "isHoliday": true, "description": "測試假日"}]'.encode('utf-8')
+        calculator = HolidayDateCalculator(
+            data_fetcher=HolidayDataFetcher(cache=HolidayDataCache({}), session=_FakeSession(content))
+        )
         
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        from datetime import datetime
-        holiday = {'date': '20310123', 'week': '日', 'description': '小年夜'}
-        dep, ret = self.calculator.calculate_date_range(holiday)
+        first = calculator.calculate_dates_bytes(0)
+        second = calculator.calculate_dates_bytes(0)
         
-        # 小年夜在週日：前2天到後3天 (-2, 3)
-        assert dep == datetime(2031, 1, 21)
-        assert ret == datetime(2031, 1, 26)
+        assert first is second
+        payload = json.loads(first)
+        assert payload["success"] is True
+        assert payload["data"]["holidays"][0]["holiday_name"] == "測試假日"
 
-    def test_calculate_date_range_invalid_date_format(self):
-        """
-        測試無效日期格式的錯誤處理。
+    def test_calculate_dates_bytes_serializes_cached_result_without_copy(self, holiday_date_calculator, monkeypatch):
+        """測試序列化響應時直接使用緩存中的結果，不另外複製。"""
+        def fail_copy(result):
+            pytest.fail("calculate_dates_bytes 不應複製計算結果")
+        monkeypatch.setattr(HolidayDateCalculator, "_copy_result", staticmethod(fail_copy))
         
-        驗證當日期格式錯誤時，拋出 ValueError。
+        body = holiday_date_calculator.calculate_dates_bytes(2)
         
-        Args:
-            無
+        assert json.loads(body)["data"]["target_month"] == 5
+        assert (2025, 5, 2) in holiday_date_calculator._result_cache
+
+
+class TestHolidayFilter:
+    """
+    測試 HolidayFilter 類別
+    """
+
+    def test_should_skip_spring_festival(self, holiday_filter):
+        """測試春節過濾。"""
+        holiday = {'description': '春節', 'date': '20250129'}
+        assert holiday_filter.should_skip_holiday(holiday, 2) is True
+
+    def test_should_skip_lunar_new_year_eve(self, holiday_filter):
+        """測試農曆除夕過濾。"""
+        holiday = {'description': '農曆除夕', 'date': '20250128'}
+        assert holiday_filter.should_skip_holiday(holiday, 2) is True
+
+    def test_should_skip_fixed_range_month2(self, holiday_filter):
+        """測試2個月後固定區間過濾。"""
+        holiday = {'description': '端午節', 'date': '20251207'}
+        assert holiday_filter.should_skip_holiday(holiday, 2) is True
+
+    def test_should_not_skip_normal_holiday(self, holiday_filter):
+        """測試正常節日不應被過濾。"""
+        holiday = {'description': '元旦', 'date': '20260101'}
+        assert holiday_filter.should_skip_holiday(holiday, 3) is False
+
+
+class TestHolidayDataFetcher:
+    """
+    測試 HolidayDataFetcher 類別
+    """
+
+    def test_concurrent_fetch_same_month_calls_api_once(self):
+        """測試同一年月的並行請求只呼叫外部 API 一次。"""
+        content = '[{"date": "20250101", "week": "三", "isHoliday": true, "description": "開國紀念日"}]'.encode('utf-8')
+        release = threading.Event()
+        session = _FakeSession(content, delay_event=release)
+        fetcher = HolidayDataFetcher(cache=HolidayDataCache({}), session=session)
+        
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(fetcher.fetch_taiwan_holidays(2025, 1)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+        
+        assert session.call_count == 1
+        assert len(results) == 5
+        assert all(result[0]['description'] == '開國紀念日' for result in results)
+        assert results[0][0]['_date_obj'] == datetime(2025, 1, 1)
+        assert results[0][0]['_date_iso'] == '2025-01-01'
+
+    def test_failing_fetch_same_year_never_overlaps(self):
+        """測試外部 API 持續失敗時，陸續抵達的同年份請求仍不會同時呼叫外部 API。"""
+        state = {"in_flight": 0, "max_in_flight": 0, "calls": 0}
+        state_lock = threading.Lock()
+        
+        class FailingSession:
+            def get(self, url, timeout=None):
+                with state_lock:
+                    state["calls"] += 1
+                    state["in_flight"] += 1
+                    state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+                time.sleep(0.005)
+                with state_lock:
+                    state["in_flight"] -= 1
+                return _FakeResponse(b'', status_code=503)
+        
+        fetcher = HolidayDataFetcher(cache=HolidayDataCache({}), session=FailingSession())
+        
+        threads = []
+        for _ in range(20):
+            thread = threading.Thread(target=fetcher.fetch_taiwan_holidays, args=(2025, 1))
+            thread.start()
+            threads.append(thread)
+            time.sleep(0.002)
+        for thread in threads:
+            thread.join(timeout=5)
+        
+        # 失敗的結果不會寫入緩存，每個請求都會重試，但同一時間只有一個執行緒在獲取
+        assert state["calls"] == 20
+        assert state["max_in_flight"] == 1
+
+    def test_fetch_filters_month_and_compensatory_holidays(self):
+        """測試獲取節假日時的過濾規則。"""
+        content = (
+            '\ufeff['
+            '{"date": "20250101", "week": "三", "isHoliday": true, "description": "開國紀念日"},'
+            '{"date": "20250102", "week": "四", "isHoliday": false, "description": ""},'
+            '{"date": "20250104", "week": "六", "isHoliday": true, "description": ""},'
+            '{"date": "20250110", "week": "五", "isHoliday": true, "description": "元旦補假"},'
+            '{"date": "20250228", "week": "五", "isHoliday": true, "description": "和平紀念日"}'
+            ']'
+        ).encode('utf-8')
+        session = _FakeSession(content)
+        fetcher = HolidayDataFetcher(cache=HolidayDataCache({}), session=session)
+        
+        holidays = fetcher.fetch_taiwan_holidays(2025, 1)
+        
+        assert [holiday['description'] for holiday in holidays] == ['開國紀念日']
+        
+        # 同一年其他月份已在第一次下載時寫入緩存
+        february = fetcher.fetch_taiwan_holidays(2025, 2)
+        assert [holiday['description'] for holiday in february] == ['和平紀念日']
+        assert fetcher.fetch_taiwan_holidays(2025, 3) == []
+        assert session.call_count == 1
+
+    @pytest.mark.network
+    def test_fetch_live_holiday_api(self):
+        """測試實際連線外部節假日 API，確認資料格式仍與解析邏輯相符。"""
+        fetcher = HolidayDataFetcher(cache=HolidayDataCache({}))
+        
+        holidays = fetcher.fetch_taiwan_holidays(2025, 1)
+        
+        assert '開國紀念日' in [holiday['description'] for holiday in holidays]
+        assert all(holiday['_date_obj'].year == 2025 for holiday in holidays)
+
+
+# 日期範圍測試案例的 id，依星期一到星期日排列
+WEEKDAY_IDS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+# 一般國定假日：(假日日期, 星期, 預期出發日期, 預期回程日期)
+WEEKDAY_CASES = [
+    ("20260105", "一", datetime(2026, 1, 1), datetime(2026, 1, 5)),      # 前4天到當天 (-4, 0)
+    ("20260106", "二", datetime(2026, 1, 2), datetime(2026, 1, 6)),      # 前4天到當天 (-4, 0)
+    ("20260107", "三", datetime(2026, 1, 7), datetime(2026, 1, 10)),     # 當天到後3天 (0, 3)
+    ("20260108", "四", datetime(2026, 1, 7), datetime(2026, 1, 11)),     # 前1天到後3天 (-1, 3)
+    ("20260109", "五", datetime(2026, 1, 7), datetime(2026, 1, 11)),     # 前2天到後2天 (-2, 2)
+    ("20260110", "六", datetime(2026, 1, 7), datetime(2026, 1, 11)),     # 前3天到後1天 (-3, 1)
+    ("20260111", "日", datetime(2026, 1, 7), datetime(2026, 1, 11)),     # 前4天到當天 (-4, 0)
+]
+
+# 小年夜：(小年夜日期, 星期, 預期出發日期, 預期回程日期)
+LUNAR_NEW_YEAR_CASES = [
+    ("20260126", "一", datetime(2026, 1, 24), datetime(2026, 1, 30)),    # 前2天到後4天 (-2, 4)
+    ("20250128", "二", datetime(2025, 1, 25), datetime(2025, 1, 31)),    # 前3天到後3天 (-3, 3)
+    ("20270210", "三", datetime(2027, 2, 6), datetime(2027, 2, 12)),     # 前4天到後2天 (-4, 2)
+    ("20280127", "四", datetime(2028, 1, 25), datetime(2028, 1, 31)),    # 前2天到後4天 (-2, 4)
+    ("20290216", "五", datetime(2029, 2, 14), datetime(2029, 2, 20)),    # 前2天到後4天 (-2, 4)
+    ("20300202", "六", datetime(2030, 1, 31), datetime(2030, 2, 5)),     # 前2天到後3天 (-2, 3)
+    ("20310123", "日", datetime(2031, 1, 21), datetime(2031, 1, 26)),    # 前2天到後3天 (-2, 3)
+]
+
+# 開國紀念日在週三（特殊規則，前4天到當天）：(預期出發日期, 預期回程日期)
+FOUNDING_DAY_RANGE = (datetime(2024, 12, 28), datetime(2025, 1, 1))
+
+
+class TestHolidayDateRangeCalculator:
+    """
+    測試 HolidayDateRangeCalculator 類別
+    """
+
+    @pytest.mark.parametrize("date, week, dep, ret", WEEKDAY_CASES, ids=WEEKDAY_IDS)
+    def test_calculate_date_range_general(self, range_calculator, date, week, dep, ret):
+        """測試一般國定假日在各星期的日期範圍計算。"""
+        holiday = {'date': date, 'week': week, 'description': '測試假日'}
+        dep_date, ret_date = range_calculator.calculate_date_range(holiday)
         
-        Returns:
-            None
+        assert dep_date == dep
+        assert ret_date == ret
+
+    def test_calculate_date_range_founding_day_wednesday(self, range_calculator):
+        """測試開國紀念日在週三的特殊規則。"""
+        holiday = {'date': '20250101', 'week': '三', 'description': '開國紀念日'}
         
-        Examples:
-            pytest test_app.py::TestHolidayDateRangeCalculator::test_calculate_date_range_invalid_date_format
+        assert range_calculator.calculate_date_range(holiday) == FOUNDING_DAY_RANGE
+
+    @pytest.mark.parametrize("date, week, dep, ret", LUNAR_NEW_YEAR_CASES, ids=WEEKDAY_IDS)
+    def test_calculate_date_range_lunar_new_year(self, range_calculator, date, week, dep, ret):
+        """測試小年夜在各星期的日期範圍計算。"""
+        holiday = {'date': date, 'week': week, 'description': '小年夜'}
+        dep_date, ret_date = range_calculator.calculate_date_range(holiday)
         
-        Raises:
-            AssertionError: 當測試失敗時
-        """
+        assert dep_date == dep
+        assert ret_date == ret
+
+    def test_calculate_date_range_invalid_date_format(self, range_calculator):
+        """測試無效日期格式的錯誤處理。"""
         holiday = {'date': 'invalid', 'week': '一', 'description': '測試假日'}
         
-        with pytest.raises(ValueError) as exc_info:
-            self.calculator.calculate_date_range(holiday)
-        
-        assert "無效的日期格式" in str(exc_info.value)
+        with pytest.raises(ValueError, match="無效的日期格式"):
+            range_calculator.calculate_date_range(holiday)
 
 
 class TestHolidayFlaskAPI:
@@ -1285,47 +755,8 @@ class TestHolidayFlaskAPI:
     測試節日日期 Flask API 端點
     """
 
-    @pytest.fixture
-    def client(self):
-        """
-        創建 Flask 測試客戶端。
-        
-        用於測試 API 端點。
-        
-        Args:
-            無
-        
-        Returns:
-            FlaskClient: Flask 測試客戶端
-        
-        Examples:
-            在測試方法中作為參數使用
-        
-        Raises:
-            不拋出異常
-        """
-        app.config['TESTING'] = True
-        with app.test_client() as client:
-            yield client
-
     def test_calculate_holiday_dates_endpoint_success(self, client):
-        """
-        測試成功的節日日期計算 API 請求。
-        
-        驗證 POST /calculate_holiday_dates 端點在有效輸入下返回正確結果。
-        
-        Args:
-            client: Flask 測試客戶端
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayFlaskAPI::test_calculate_holiday_dates_endpoint_success
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
+        """測試成功的節日日期計算 API 請求。"""
         response = client.post(
             '/calculate_holiday_dates',
             json={"month_offset": 2}
@@ -1334,61 +765,53 @@ class TestHolidayFlaskAPI:
         assert response.status_code == 200
         data = response.get_json()
         assert data["success"] is True
-        assert "data" in data
-        assert "target_year" in data["data"]
-        assert "target_month" in data["data"]
-        assert "holidays" in data["data"]
-
-    def test_calculate_holiday_dates_endpoint_missing_params(self, client):
-        """
-        測試缺少參數的 API 請求。
-        
-        驗證當缺少必要參數時，API 返回 400 錯誤。
-        
-        Args:
-            client: Flask 測試客戶端
-        
-        Returns:
-            None
-        
-        Examples:
-            pytest test_app.py::TestHolidayFlaskAPI::test_calculate_holiday_dates_endpoint_missing_params
-        
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        response = client.post(
-            '/calculate_holiday_dates',
-            json={}
-        )
+        assert data["data"]["target_year"] == 2025
+        assert data["data"]["target_month"] == 5
+        assert [holiday["holiday_name"] for holiday in data["data"]["holidays"]] == ["勞動節", "端午節"]
+
+    @pytest.mark.parametrize("payload", [
+        {},
+        {"month_offset": -1},
+        {"month_offset": 10 ** 21},
+        {"month_offset": float("inf")},
+    ], ids=["missing_params", "negative_offset", "offset_too_large", "infinite_offset"])
+    def test_calculate_holiday_dates_endpoint_bad_request(self, client, payload):
+        """測試缺少參數或參數無效的節日 API 請求返回 400 錯誤。"""
+        response = client.post('/calculate_holiday_dates', json=payload)
         
         assert response.status_code == 400
         data = response.get_json()
         assert "error" in data
 
-    def test_calculate_holiday_dates_endpoint_negative_offset(self, client):
-        """
-        測試負數月份偏移量的 API 請求。
+
+class TestHolidayPrefetch:
+    """
+    測試節日資料的背景預取
+    """
+
+    def test_group_offsets_by_year(self):
+        """測試月份偏移量依目標年份分組。"""
+        calculator = _canned_holiday_calculator()
         
-        驗證當月份偏移量為負數時，API 返回 400 錯誤。
+        offsets_by_year = calculator.group_offsets_by_year(range(12))
         
-        Args:
-            client: Flask 測試客戶端
+        assert offsets_by_year == {2025: list(range(10)), 2026: [10, 11]}
+
+    def test_prefetch_year_fetches_once(self):
+        """測試預取時同一年份只獲取一次，並預先產生各月份偏移量的響應。"""
+        calculator = _canned_holiday_calculator()
+        session = calculator.data_fetcher.session
         
-        Returns:
-            None
+        assert calculator.prefetch_year(2025, [0, 1, 2]) is True
         
-        Examples:
-            pytest test_app.py::TestHolidayFlaskAPI::test_calculate_holiday_dates_endpoint_negative_offset
+        assert session.call_count == 1
+        assert set(calculator._response_bytes_cache) == {(2025, 3, 0), (2025, 4, 1), (2025, 5, 2)}
+
+    def test_prefetch_year_skips_when_fetch_fails(self):
+        """測試外部 API 未成功回應時返回 False，不預先產生響應。"""
+        calculator = _canned_holiday_calculator()
+        calculator.data_fetcher.session.get = lambda url, timeout=None: _FakeResponse(b'', status_code=503)
         
-        Raises:
-            AssertionError: 當測試失敗時
-        """
-        response = client.post(
-            '/calculate_holiday_dates',
-            json={"month_offset": -1}
-        )
+        assert calculator.prefetch_year(2025, [0, 1]) is False
         
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "error" in data
+        assert calculator._response_bytes_cache == {}